@@ -9,8 +9,25 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
+from typing import TYPE_CHECKING, Any
+
 from .config import Config, get_config
-from .solr_client import SOLRClient
-from .server import SOLRMCPServer
+
+if TYPE_CHECKING:
+    from .server import SOLRMCPServer
+    from .solr_client import SOLRClient
 
 __all__ = ["Config", "get_config", "SOLRClient", "SOLRMCPServer"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client and server lazily (PEP 562), they pull in pysolr and MCP."""
+    if name == "SOLRClient":
+        from .solr_client import SOLRClient
+
+        return SOLRClient
+    if name == "SOLRMCPServer":
+        from .server import SOLRMCPServer
+
+        return SOLRMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
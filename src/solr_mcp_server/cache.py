@@ -0,0 +1,75 @@
+"""
+In-process caching for the SOLR MCP Server.
+
+This module provides a small LRU cache with per-entry expiry, used to avoid
+repeated SOLR roundtrips for data that does not need to be fresh on every call.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    A bounded LRU cache whose entries expire after a time-to-live.
+
+    A ``ttl`` of zero or less disables the cache: lookups always miss and
+    nothing is stored. Not thread-safe; intended for use from the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the
+                least recently used one.
+            ttl: Default time-to-live for entries, in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Return the cached value for ``key``, or None if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Optional time-to-live overriding the cache default.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
@@ -6,16 +6,63 @@ and .env files using Pydantic for robust configuration management.
 """
 
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Optional, TextIO, Tuple, Union
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Every environment variable read by Config.from_env.
+_ENV_VARS = (
+    "SOLR_BASE_URL",
+    "SOLR_COLLECTION",
+    "SOLR_USERNAME",
+    "SOLR_PASSWORD",
+    "SOLR_TIMEOUT",
+    "SOLR_VERIFY_SSL",
+    "SOLR_MAX_ROWS",
+    "SOLR_DEFAULT_SEARCH_FIELD",
+    "SOLR_FACET_LIMIT",
+    "SOLR_HIGHLIGHT_ENABLED",
+    "SOLR_MAX_CONCURRENT_REQUESTS",
+    "SOLR_MAX_CONNECTIONS",
+    "SOLR_SCHEMA_CACHE_TTL",
+    "SOLR_STATS_CACHE_TTL",
+    "SOLR_QUERY_CACHE_TTL",
+    "SOLR_FACET_CACHE_TTL",
+    "MCP_SERVER_HOST",
+    "MCP_SERVER_PORT",
+    "LOG_LEVEL",
+    "MCP_PRETTY_JSON",
+    "OLLAMA_BASE_URL",
+    "OLLAMA_MODEL",
+)
+
+_HTTP_SCHEME = re.compile(r"^https?://").match
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_LEVELS_STR = ", ".join(sorted(_VALID_LOG_LEVELS))
+
+
+def _bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return value.lower() == "true"
+
+
+def _validate_http_url(v: str, service: str) -> str:
+    """Check that a base URL uses http(s) and strip a single trailing slash."""
+    if not _HTTP_SCHEME(v):
+        raise ValueError(f"{service} base URL must start with http:// or https://")
+    return v[:-1] if v.endswith("/") else v
 
 
 class SOLRConfig(BaseModel):
     """Configuration for SOLR connection and operations."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str = Field(
         default="http://localhost:8983/solr",
         description="Base URL for the SOLR instance",
@@ -43,24 +90,73 @@ class SOLRConfig(BaseModel):
     highlight_enabled: bool = Field(
         default=True, description="Whether to enable result highlighting by default"
     )
+    max_concurrent_requests: int = Field(
+        default=10, description="Maximum number of concurrent requests to SOLR"
+    )
+    max_connections: int = Field(
+        default=50, description="Maximum pooled HTTP connections to SOLR"
+    )
+    schema_cache_ttl: int = Field(
+        default=300,
+        description="Seconds to cache schema fields (0 disables caching)",
+    )
+    stats_cache_ttl: int = Field(
+        default=30,
+        description="Seconds to cache collection statistics (0 disables caching)",
+    )
+    query_cache_ttl: int = Field(
+        default=30,
+        description="Seconds to cache search results (0 disables caching)",
+    )
+    facet_cache_ttl: int = Field(
+        default=60,
+        description="Seconds to cache facet counts (0 disables caching)",
+    )
 
-    @validator("base_url")
+    @field_validator("base_url")
+    @classmethod
     def validate_base_url(cls, v: str) -> str:
         """Validate that the base URL is properly formatted."""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("SOLR base URL must start with http:// or https://")
-        if v.endswith("/"):
-            v = v.rstrip("/")
-        return v
+        return _validate_http_url(v, "SOLR")
 
-    @validator("timeout")
+    @field_validator("timeout")
+    @classmethod
     def validate_timeout(cls, v: int) -> int:
         """Validate that timeout is positive."""
         if v <= 0:
             raise ValueError("Timeout must be positive")
         return v
 
-    @validator("max_rows")
+    @field_validator("max_concurrent_requests")
+    @classmethod
+    def validate_max_concurrent_requests(cls, v: int) -> int:
+        """Validate that the concurrency limit is positive."""
+        if v <= 0:
+            raise ValueError("Max concurrent requests must be positive")
+        return v
+
+    @field_validator(
+        "schema_cache_ttl", "stats_cache_ttl", "query_cache_ttl", "facet_cache_ttl"
+    )
+    @classmethod
+    def validate_cache_ttl(cls, v: int) -> int:
+        """Validate that cache TTLs are not negative."""
+        if v < 0:
+            raise ValueError("Cache TTL must not be negative")
+        return v
+
+    @field_validator("max_connections")
+    @classmethod
+    def validate_max_connections(cls, v: int) -> int:
+        """Validate that the connection pool size is positive and reasonable."""
+        if v <= 0:
+            raise ValueError("Max connections must be positive")
+        if v > 10000:
+            raise ValueError("Max connections should not exceed 10000")
+        return v
+
+    @field_validator("max_rows")
+    @classmethod
     def validate_max_rows(cls, v: int) -> int:
         """Validate that max_rows is positive and reasonable."""
         if v <= 0:
@@ -73,30 +169,38 @@ class SOLRConfig(BaseModel):
 class MCPConfig(BaseModel):
     """Configuration for the MCP server."""
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(default="localhost", description="Host to bind the MCP server to")
     port: int = Field(default=8080, description="Port to bind the MCP server to")
     log_level: str = Field(default="INFO", description="Logging level")
+    pretty_json: bool = Field(
+        default=False, description="Whether to indent JSON tool responses"
+    )
 
-    @validator("port")
+    @field_validator("port")
+    @classmethod
     def validate_port(cls, v: int) -> int:
         """Validate that port is in valid range."""
         if not (1 <= v <= 65535):
             raise ValueError("Port must be between 1 and 65535")
         return v
 
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate that log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Log level must be one of: {', '.join(valid_levels)}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of: {_VALID_LOG_LEVELS_STR}")
         return v_upper
 
 
 class OllamaConfig(BaseModel):
     """Configuration for optional Ollama integration."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str = Field(
         default="http://localhost:11434", description="Base URL for Ollama API"
     )
@@ -104,31 +208,34 @@ class OllamaConfig(BaseModel):
         default="llama2", description="Default model to use for LLM operations"
     )
 
-    @validator("base_url")
+    @field_validator("base_url")
+    @classmethod
     def validate_base_url(cls, v: str) -> str:
         """Validate that the base URL is properly formatted."""
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("Ollama base URL must start with http:// or https://")
-        if v.endswith("/"):
-            v = v.rstrip("/")
-        return v
+        return _validate_http_url(v, "Ollama")
 
 
 class Config(BaseModel):
     """Main configuration class that combines all configuration sections."""
 
+    model_config = ConfigDict(frozen=True)
+
     solr: SOLRConfig
     mcp: MCPConfig = Field(default_factory=MCPConfig)
     ollama: Optional[OllamaConfig] = Field(default=None)
 
     @classmethod
-    def from_env(cls, env_file: Optional[Union[str, Path]] = None) -> "Config":
+    def from_env(cls, env_file: Optional[Union[str, Path, TextIO]] = None) -> "Config":
         """
         Load configuration from environment variables and optional .env file.
 
+        Values already set in the environment take precedence over the .env
+        file, which is not read at all when every setting is already present.
+
         Args:
-            env_file: Optional path to .env file. If not provided, looks for .env
-                     in the current directory.
+            env_file: Optional path to .env file, or an open text stream with
+                     .env contents. If not provided, looks for .env in the
+                     current directory.
 
         Returns:
             Configured Config instance.
@@ -143,60 +250,114 @@ class Config(BaseModel):
         if isinstance(env_file, str):
             env_file = Path(env_file)
 
-        if env_file.exists():
-            load_dotenv(env_file)
-
-        # Build SOLR config from environment variables
-        solr_config = SOLRConfig(
-            base_url=os.getenv("SOLR_BASE_URL", "http://localhost:8983/solr"),
-            collection=os.getenv("SOLR_COLLECTION", ""),
-            username=os.getenv("SOLR_USERNAME") or None,
-            password=os.getenv("SOLR_PASSWORD") or None,
-            timeout=int(os.getenv("SOLR_TIMEOUT", "30")),
-            verify_ssl=os.getenv("SOLR_VERIFY_SSL", "true").lower() == "true",
-            max_rows=int(os.getenv("SOLR_MAX_ROWS", "1000")),
-            default_search_field=os.getenv("SOLR_DEFAULT_SEARCH_FIELD", "text"),
-            facet_limit=int(os.getenv("SOLR_FACET_LIMIT", "100")),
-            highlight_enabled=os.getenv("SOLR_HIGHLIGHT_ENABLED", "true").lower()
-            == "true",
-        )
-
-        if not solr_config.collection:
+        # Variables already present in the environment take precedence, so the
+        # file only needs parsing when it could still supply something.
+        env = os.environ
+        if not all(var in env for var in _ENV_VARS):
+            if isinstance(env_file, Path):
+                if env_file.exists():
+                    load_dotenv(env_file, override=False)
+            else:
+                load_dotenv(stream=env_file, override=False)
+
+        # Fail fast before running any validators
+        collection = env.get("SOLR_COLLECTION")
+        if not collection:
             raise ValueError("SOLR_COLLECTION environment variable is required")
 
+        # Build SOLR config from environment variables. Numeric values are
+        # passed through as strings and coerced by pydantic.
+        solr_raw: Dict[str, Any] = {
+            "base_url": env.get("SOLR_BASE_URL", "http://localhost:8983/solr"),
+            "collection": collection,
+            "username": env.get("SOLR_USERNAME") or None,
+            "password": env.get("SOLR_PASSWORD") or None,
+            "timeout": env.get("SOLR_TIMEOUT", "30"),
+            "verify_ssl": _bool(env.get("SOLR_VERIFY_SSL", "true")),
+            "max_rows": env.get("SOLR_MAX_ROWS", "1000"),
+            "default_search_field": env.get("SOLR_DEFAULT_SEARCH_FIELD", "text"),
+            "facet_limit": env.get("SOLR_FACET_LIMIT", "100"),
+            "highlight_enabled": _bool(env.get("SOLR_HIGHLIGHT_ENABLED", "true")),
+            "max_concurrent_requests": env.get("SOLR_MAX_CONCURRENT_REQUESTS", "10"),
+            "max_connections": env.get("SOLR_MAX_CONNECTIONS", "50"),
+            "schema_cache_ttl": env.get("SOLR_SCHEMA_CACHE_TTL", "300"),
+            "stats_cache_ttl": env.get("SOLR_STATS_CACHE_TTL", "30"),
+            "query_cache_ttl": env.get("SOLR_QUERY_CACHE_TTL", "30"),
+            "facet_cache_ttl": env.get("SOLR_FACET_CACHE_TTL", "60"),
+        }
+
         # Build MCP config from environment variables
-        mcp_config = MCPConfig(
-            host=os.getenv("MCP_SERVER_HOST", "localhost"),
-            port=int(os.getenv("MCP_SERVER_PORT", "8080")),
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-        )
+        mcp_raw: Dict[str, Any] = {
+            "host": env.get("MCP_SERVER_HOST", "localhost"),
+            "port": env.get("MCP_SERVER_PORT", "8080"),
+            "log_level": env.get("LOG_LEVEL", "INFO"),
+            "pretty_json": _bool(env.get("MCP_PRETTY_JSON", "false")),
+        }
 
         # Build Ollama config if environment variables are present
-        ollama_config = None
-        ollama_base_url = os.getenv("OLLAMA_BASE_URL")
-        ollama_model = os.getenv("OLLAMA_MODEL")
+        ollama_raw: Optional[Dict[str, Any]] = None
+        ollama_base_url = env.get("OLLAMA_BASE_URL")
+        ollama_model = env.get("OLLAMA_MODEL")
 
         if ollama_base_url or ollama_model:
-            ollama_config = OllamaConfig(
-                base_url=ollama_base_url or "http://localhost:11434",
-                model=ollama_model or "llama2",
-            )
-
-        return cls(
-            solr=solr_config,
-            mcp=mcp_config,
-            ollama=ollama_config,
+            ollama_raw = {
+                "base_url": ollama_base_url or "http://localhost:11434",
+                "model": ollama_model or "llama2",
+            }
+
+        # Validate all sections in a single pass over the nested schema
+        return cls.model_validate(
+            {"solr": solr_raw, "mcp": mcp_raw, "ollama": ollama_raw}
         )
 
 
+# Loaded configurations, keyed on the resolved .env path and a snapshot of the
+# configuration environment variables, most recently used last
+_CONFIG_CACHE_SIZE = 4
+_config_cache: "OrderedDict[Tuple[Path, Tuple[Optional[str], ...]], Config]" = (
+    OrderedDict()
+)
+
+
+def _env_snapshot() -> Tuple[Optional[str], ...]:
+    """Snapshot the configuration environment variables."""
+    return tuple(os.environ.get(var) for var in _ENV_VARS)
+
+
 def get_config(env_file: Optional[Union[str, Path]] = None) -> Config:
     """
     Convenience function to get configuration.
 
+    The result is cached per resolved .env path and snapshot of the
+    configuration environment variables, so repeated calls skip re-reading the
+    .env file and re-validating. Call ``get_config.cache_clear()`` to force a
+    reload, e.g. after editing the .env file.
+
     Args:
         env_file: Optional path to .env file.
 
     Returns:
         Configured Config instance.
     """
-    return Config.from_env(env_file)
+    if env_file is None:
+        env_file = Path.cwd() / ".env"
+    path = Path(env_file).resolve()
+    key = (path, _env_snapshot())
+
+    config = _config_cache.get(key)
+    if config is not None:
+        _config_cache.move_to_end(key)
+        return config
+
+    config = Config.from_env(path)
+    # Loading the .env file adds its variables to the environment, so later
+    # calls see a different snapshot; file the result under that one as well
+    for cache_key in (key, (path, _env_snapshot())):
+        _config_cache[cache_key] = config
+        _config_cache.move_to_end(cache_key)
+    while len(_config_cache) > _CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+    return config
+
+
+get_config.cache_clear = _config_cache.clear  # type: ignore[attr-defined]
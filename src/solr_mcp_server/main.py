@@ -10,12 +10,21 @@ import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import argparse
 
 from .config import get_config
-from .server import run_server
+
+_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 def setup_logging(log_level: str) -> None:
@@ -23,13 +32,22 @@ def setup_logging(log_level: str) -> None:
     Set up logging configuration.
 
     Args:
-        log_level: The logging level to use.
+        log_level: The logging level to use. Normally already upper-cased by
+            MCPConfig validation.
     """
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    level = _LEVELS.get(log_level)
+    if level is None:
+        level = _LEVELS[log_level.upper()]
+
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    # Log to stderr (stdout carries the MCP protocol); only install a handler
+    # once so repeated calls do not duplicate output.
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(_FORMATTER)
+        root.addHandler(handler)
 
     # Set specific loggers to appropriate levels
     logging.getLogger("pysolr").setLevel(logging.WARNING)
@@ -83,6 +101,36 @@ Environment Variables:
     return parser
 
 
+# Built once at import; main() may be re-entered (tests, supervisors).
+_PARSER = create_arg_parser()
+
+
+def _install_shutdown_handlers(
+    loop: asyncio.AbstractEventLoop, task: "asyncio.Task[None]"
+) -> None:
+    """Cancel the running server task on SIGINT/SIGTERM."""
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, task.cancel)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler
+            signal.signal(
+                sig, lambda signum, frame: loop.call_soon_threadsafe(task.cancel)
+            )
+
+
+def _remove_shutdown_handlers(loop: asyncio.AbstractEventLoop) -> None:
+    """Restore default SIGINT/SIGTERM handling."""
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.remove_signal_handler(sig)
+        except NotImplementedError:
+            signal.signal(
+                sig,
+                signal.default_int_handler if sig == signal.SIGINT else signal.SIG_DFL,
+            )
+
+
 async def main_async(
     env_file: Optional[Path] = None,
     log_level_override: Optional[str] = None,
@@ -103,9 +151,15 @@ async def main_async(
         # Load configuration
         config = get_config(env_file)
 
-        # Override log level if specified
+        # Override log level if specified (config is frozen, so copy it)
         if log_level_override:
-            config.mcp.log_level = log_level_override.upper()
+            config = config.model_copy(
+                update={
+                    "mcp": config.mcp.model_copy(
+                        update={"log_level": log_level_override.upper()}
+                    )
+                }
+            )
 
         # Set up logging
         setup_logging(config.mcp.log_level)
@@ -113,86 +167,56 @@ async def main_async(
 
         if validate_only:
             logger.info("Configuration validation successful!")
-            logger.info(f"SOLR Collection: {config.solr.collection}")
-            logger.info(f"SOLR URL: {config.solr.base_url}")
-            logger.info(f"MCP Server: {config.mcp.host}:{config.mcp.port}")
+            logger.info("SOLR Collection: %s", config.solr.collection)
+            logger.info("SOLR URL: %s", config.solr.base_url)
+            logger.info("MCP Server: %s:%s", config.mcp.host, config.mcp.port)
             if config.ollama:
-                logger.info(f"Ollama: {config.ollama.base_url} ({config.ollama.model})")
+                logger.info(
+                    "Ollama: %s (%s)", config.ollama.base_url, config.ollama.model
+                )
             return 0
 
         logger.info("Starting SOLR MCP Server...")
-        logger.info(f"SOLR Collection: {config.solr.collection}")
-        logger.info(f"SOLR URL: {config.solr.base_url}")
+        logger.info("SOLR Collection: %s", config.solr.collection)
+        logger.info("SOLR URL: %s", config.solr.base_url)
 
-        # Set up graceful shutdown
-        shutdown_event = asyncio.Event()
-
-        def signal_handler(signum: int, frame) -> None:
-            logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            shutdown_event.set()
-
-        # Register signal handlers
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Imported here so --validate-config does not load pysolr and MCP
+        from .server import run_server
 
         # Run the server with proper error handling and recovery
+        loop = asyncio.get_running_loop()
         max_retries = 3
         retry_delay = 5.0
 
         for attempt in range(max_retries):
-            try:
-                server_task = asyncio.create_task(run_server(config))
-                shutdown_task = asyncio.create_task(shutdown_event.wait())
-
-                logger.info(f"Starting server (attempt {attempt + 1}/{max_retries})...")
-
-                # Wait for either the server to complete or shutdown signal
-                done, pending = await asyncio.wait(
-                    [server_task, shutdown_task], return_when=asyncio.FIRST_COMPLETED
-                )
+            server_task = asyncio.create_task(run_server(config))
+            _install_shutdown_handlers(loop, server_task)
 
-                # If shutdown was requested, cancel server and exit cleanly
-                if shutdown_task in done:
-                    logger.info("Shutdown requested, stopping server...")
-                    server_task.cancel()
-                    try:
-                        await asyncio.wait_for(server_task, timeout=10.0)
-                    except (asyncio.CancelledError, asyncio.TimeoutError):
-                        pass
-                    break
-
-                # If server completed, check for errors
-                if server_task in done:
-                    try:
-                        await server_task
-                        # If we get here, server completed successfully
-                        logger.info("Server completed successfully")
-                        break
-                    except Exception as e:
-                        logger.error(f"Server error on attempt {attempt + 1}: {e}")
-
-                        # Cancel shutdown task
-                        shutdown_task.cancel()
-                        try:
-                            await shutdown_task
-                        except asyncio.CancelledError:
-                            pass
-
-                        # If this was the last attempt, give up
-                        if attempt == max_retries - 1:
-                            logger.error("Maximum retry attempts exceeded")
-                            return 1
-
-                        # Wait before retry
-                        logger.info(f"Retrying in {retry_delay} seconds...")
-                        await asyncio.sleep(retry_delay)
-                        retry_delay *= 1.5  # Exponential backoff
+            logger.info("Starting server (attempt %d/%d)...", attempt + 1, max_retries)
 
+            try:
+                await server_task
+                # If we get here, server completed successfully
+                logger.info("Server completed successfully")
+                break
+            except asyncio.CancelledError:
+                # A shutdown signal cancelled the server task
+                logger.info("Shutdown requested, stopping server...")
+                break
             except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
+                logger.error("Server error on attempt %d: %s", attempt + 1, e)
+
+                # If this was the last attempt, give up
                 if attempt == max_retries - 1:
+                    logger.error("Maximum retry attempts exceeded")
                     return 1
+
+                # Wait before retry
+                logger.info("Retrying in %s seconds...", retry_delay)
                 await asyncio.sleep(retry_delay)
+                retry_delay *= 1.5  # Exponential backoff
+            finally:
+                _remove_shutdown_handlers(loop)
 
         logger.info("SOLR MCP Server shutdown completed")
         return 0
@@ -205,12 +229,22 @@ async def main_async(
         return 1
 
 
+def _install_uvloop() -> None:
+    """Make asyncio create uvloop event loops when uvloop is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main() -> None:
     """Main entry point for the command-line interface."""
-    parser = create_arg_parser()
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
-    # Run the async main function
+    # asyncio.run also cancels leftover tasks and shuts down the default
+    # executor before closing the loop
+    _install_uvloop()
     exit_code = asyncio.run(
         main_async(
             env_file=args.env_file,
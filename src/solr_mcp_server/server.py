@@ -5,10 +5,26 @@ This module provides an MCP server that exposes SOLR search capabilities through
 various tools including basic search, advanced search, faceted search, and more.
 """
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from mcp import McpError, Tool
 from mcp.server import Server, InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -21,11 +37,288 @@ from mcp.types import (
     Tool as ToolDefinition,
 )
 
+from .cache import TTLCache
 from .config import Config
-from .solr_client import SOLRClient, SOLRClientError
+from .solr_client import SearchResponse, SOLRClient, SOLRClientError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Pick the JSON encoder once at import rather than on every tool call.
+try:
+    import orjson
+
+    _ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS
+    _ORJSON_PRETTY = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    def _dumps(obj: Any, pretty: bool) -> str:
+        option = _ORJSON_PRETTY if pretty else _ORJSON_COMPACT
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _dumps(obj: Any, pretty: bool) -> str:
+        if pretty:
+            return json.dumps(obj, indent=2, default=str)
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def _to_text(obj: Any, pretty: bool = False) -> TextContent:
+    """
+    Serialize a tool result to JSON text content, using orjson if available.
+
+    Output is compact unless ``pretty`` is set, since MCP clients parse it
+    programmatically.
+    """
+    return TextContent(type="text", text=_dumps(obj, pretty))
+
+
+def _response_to_text(
+    response: SearchResponse, include: Dict[str, Any], pretty: bool = False
+) -> TextContent:
+    """
+    Serialize selected parts of a SearchResponse to JSON text content.
+
+    pydantic-core writes the JSON straight from the model, so no intermediate
+    per-result or per-facet dicts are built.
+    """
+    text = response.model_dump_json(
+        include=include, by_alias=True, indent=2 if pretty else None
+    )
+    return TextContent(type="text", text=text)
+
+
+# Fields of SearchResponse returned by the search tools
+_SEARCH_INCLUDE: Dict[str, Any] = {
+    "total_found": True,
+    "start": True,
+    "rows": True,
+    "query_time": True,
+    "results": {"__all__": {"id", "score", "fields"}},
+}
+_HIGHLIGHT_INCLUDE: Dict[str, Any] = {
+    **_SEARCH_INCLUDE,
+    "results": {"__all__": {"id", "score", "fields", "highlighting"}},
+}
+_FACET_INCLUDE: Dict[str, Any] = {
+    "total_found": True,
+    "query_time": True,
+    "facets": True,
+    "results": {"__all__": {"id", "score", "fields"}},
+}
+
+
+# Schema fragments shared between the tool definitions below
+_QUERY_SCHEMA: Dict[str, Any] = {
+    "type": "string",
+    "description": "Search query string",
+    "minLength": 1,
+}
+_ROWS_SCHEMA: Dict[str, Any] = {
+    "type": "integer",
+    "description": "Number of results to return (max 1000)",
+    "minimum": 1,
+    "maximum": 1000,
+    "default": 10,
+}
+_START_SCHEMA: Dict[str, Any] = {
+    "type": "integer",
+    "description": "Starting offset for pagination",
+    "minimum": 0,
+    "default": 0,
+}
+_STRING_ITEMS: Dict[str, Any] = {"type": "string"}
+_FIELDS_SCHEMA: Dict[str, Any] = {
+    "type": "array",
+    "items": _STRING_ITEMS,
+    "description": "List of fields to return",
+}
+_NO_ARGUMENTS_SCHEMA: Dict[str, Any] = {"type": "object", "properties": {}}
+
+
+# Tool definitions are static, so build them once rather than per list_tools call.
+_TOOL_DEFINITIONS: Tuple[ToolDefinition, ...] = (
+    ToolDefinition(
+        name="search",
+        description="Perform basic search in SOLR collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_SCHEMA,
+                "fields": _FIELDS_SCHEMA,
+                "rows": _ROWS_SCHEMA,
+                "start": _START_SCHEMA,
+            },
+            "required": ["query"],
+        },
+    ),
+    ToolDefinition(
+        name="advanced_search",
+        description="Perform advanced search with filters and field selection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_SCHEMA,
+                "query_fields": {
+                    "type": "array",
+                    "items": _STRING_ITEMS,
+                    "description": "List of fields to search in (qf parameters)",
+                },
+                "fields": _FIELDS_SCHEMA,
+                "filters": {
+                    "type": "array",
+                    "items": _STRING_ITEMS,
+                    "description": "List of filter queries (fq parameters)",
+                },
+                "sort": {
+                    "type": "string",
+                    "description": "Sort specification (e.g., 'score desc', 'date asc')",
+                },
+                "rows": _ROWS_SCHEMA,
+                "start": _START_SCHEMA,
+            },
+            "required": ["query"],
+        },
+    ),
+    ToolDefinition(
+        name="faceted_search",
+        description="Perform faceted search to get aggregated counts",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_SCHEMA,
+                "facet_fields": {
+                    "type": "array",
+                    "items": _STRING_ITEMS,
+                    "description": "List of fields to facet on",
+                    "minItems": 1,
+                },
+                "filters": {
+                    "type": "array",
+                    "items": _STRING_ITEMS,
+                    "description": "List of filter queries",
+                },
+                "rows": {**_ROWS_SCHEMA, "minimum": 0},
+            },
+            "required": ["query", "facet_fields"],
+        },
+    ),
+    ToolDefinition(
+        name="search_with_highlighting",
+        description="Search with result highlighting",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_SCHEMA,
+                "highlight_fields": {
+                    "type": "array",
+                    "items": _STRING_ITEMS,
+                    "description": "Fields to highlight (empty for all fields)",
+                },
+                "fields": _FIELDS_SCHEMA,
+                "rows": _ROWS_SCHEMA,
+                "start": _START_SCHEMA,
+            },
+            "required": ["query"],
+        },
+    ),
+    ToolDefinition(
+        name="get_suggestions",
+        description="Get spelling suggestions for a query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Query to get suggestions for",
+                    "minLength": 1,
+                },
+                "count": {
+                    "type": "integer",
+                    "description": "Maximum number of suggestions",
+                    "minimum": 1,
+                    "maximum": 20,
+                    "default": 5,
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    ToolDefinition(
+        name="get_schema_fields",
+        description="Get available fields in the SOLR schema",
+        inputSchema=_NO_ARGUMENTS_SCHEMA,
+    ),
+    ToolDefinition(
+        name="get_collection_stats",
+        description="Get basic statistics about the SOLR collection",
+        inputSchema=_NO_ARGUMENTS_SCHEMA,
+    ),
+    ToolDefinition(
+        name="ping_solr",
+        description="Test SOLR connection",
+        inputSchema=_NO_ARGUMENTS_SCHEMA,
+    ),
+)
+
+
+# Check each input schema once and keep a ready validator per tool, instead of
+# re-checking the schema on every call or hand-writing per-handler checks.
+def _compile_validator(schema: Dict[str, Any]) -> Any:
+    """Check a tool input schema and build its validator."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+_VALIDATORS: Dict[str, Any] = {
+    tool.name: _compile_validator(tool.inputSchema) for tool in _TOOL_DEFINITIONS
+}
+
+
+def _validate_arguments(name: str, arguments: Dict[str, Any]) -> None:
+    """
+    Validate tool arguments against the tool's input schema.
+
+    Raises:
+        McpError: With INVALID_PARAMS if the arguments do not match the schema.
+    """
+    try:
+        _VALIDATORS[name].validate(arguments)
+    except ValidationError as e:
+        raise McpError(
+            ErrorData(
+                code=INVALID_PARAMS,
+                message=f"Invalid arguments for {name}: {e.message}",
+            )
+        )
+
+
+# Search tools whose rendered responses may be served from the query cache
+_CACHEABLE_TOOLS = frozenset(
+    {"search", "advanced_search", "faceted_search", "search_with_highlighting"}
+)
+_QUERY_CACHE_SIZE = 256
+
+
+def _query_key(name: str, arguments: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Build a canonical cache key for a tool call, or None if it can't be hashed.
+    """
+    key = (
+        name,
+        tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in sorted(arguments.items())
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 class SOLRMCPServer:
     """
@@ -45,241 +338,168 @@ class SOLRMCPServer:
         """
         self.config = config
         self.solr_client = SOLRClient(config.solr)
+        # Dedicated worker threads for SOLR calls, one per allowed request, so
+        # concurrent searches don't queue behind the loop's shared default pool.
+        # The pool size is also the limit on SOLR requests in flight.
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.solr.max_concurrent_requests,
+            thread_name_prefix="solr",
+        )
+        self._pretty = config.mcp.pretty_json
+        self._closed = False
+        # Rendered stats response; it changes rarely, so repeated polls are
+        # served without a SOLR roundtrip. Schema fields are cached by the
+        # client itself.
+        self._metadata_cache: TTLCache[List[TextContent]] = TTLCache(
+            maxsize=1, ttl=config.solr.stats_cache_ttl
+        )
+        # Rendered search responses keyed on the canonical tool arguments
+        self._query_cache: TTLCache[List[TextContent]] = TTLCache(
+            maxsize=_QUERY_CACHE_SIZE, ttl=config.solr.query_cache_ttl
+        )
+        self._inflight: Dict[Hashable, "asyncio.Future[List[TextContent]]"] = {}
         self.server = Server("solr-mcp-server")
+        self._dispatch: Dict[
+            str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]
+        ] = {
+            "search": self._handle_search,
+            "advanced_search": self._handle_advanced_search,
+            "faceted_search": self._handle_faceted_search,
+            "search_with_highlighting": self._handle_search_with_highlighting,
+            "get_suggestions": self._handle_get_suggestions,
+            "get_schema_fields": self._handle_get_schema_fields,
+            "get_collection_stats": self._handle_get_collection_stats,
+            "ping_solr": self._handle_ping_solr,
+        }
         self._setup_tools()
 
+    @classmethod
+    async def create(cls, config: Config) -> "SOLRMCPServer":
+        """
+        Create the server without blocking the event loop.
+
+        Connecting to SOLR pings with retries and backoff sleeps, so the
+        constructor runs in a worker thread.
+
+        Args:
+            config: Configuration object containing SOLR and MCP settings.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, cls, config)
+
     def _setup_tools(self) -> None:
         """Set up all available tools for the MCP server."""
 
         @self.server.list_tools()
         async def handle_list_tools() -> List[ToolDefinition]:
             """List all available tools."""
-            return [
-                ToolDefinition(
-                    name="search",
-                    description="Perform basic search in SOLR collection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query string",
-                            },
-                            "rows": {
-                                "type": "integer",
-                                "description": "Number of results to return (max 1000)",
-                                "minimum": 1,
-                                "maximum": 1000,
-                                "default": 10,
-                            },
-                            "start": {
-                                "type": "integer",
-                                "description": "Starting offset for pagination",
-                                "minimum": 0,
-                                "default": 0,
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                ToolDefinition(
-                    name="advanced_search",
-                    description="Perform advanced search with filters and field selection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query string",
-                            },
-                            "query_fields": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of fields to search in (qf parameters)",
-                            },
-                            "fields": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of fields to return",
-                            },
-                            "filters": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of filter queries (fq parameters)",
-                            },
-                            "sort": {
-                                "type": "string",
-                                "description": "Sort specification (e.g., 'score desc', 'date asc')",
-                            },
-                            "rows": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 1000,
-                                "default": 10,
-                            },
-                            "start": {"type": "integer", "minimum": 0, "default": 0},
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                ToolDefinition(
-                    name="faceted_search",
-                    description="Perform faceted search to get aggregated counts",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query string",
-                            },
-                            "facet_fields": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of fields to facet on",
-                            },
-                            "filters": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of filter queries",
-                            },
-                            "rows": {
-                                "type": "integer",
-                                "minimum": 0,
-                                "maximum": 1000,
-                                "default": 10,
-                            },
-                        },
-                        "required": ["query", "facet_fields"],
-                    },
-                ),
-                ToolDefinition(
-                    name="search_with_highlighting",
-                    description="Search with result highlighting",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query string",
-                            },
-                            "highlight_fields": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Fields to highlight (empty for all fields)",
-                            },
-                            "rows": {
-                                "type": "integer",
-                                "minimum": 1,
-                                "maximum": 1000,
-                                "default": 10,
-                            },
-                            "start": {"type": "integer", "minimum": 0, "default": 0},
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                ToolDefinition(
-                    name="get_suggestions",
-                    description="Get spelling suggestions for a query",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Query to get suggestions for",
-                            },
-                            "count": {
-                                "type": "integer",
-                                "description": "Maximum number of suggestions",
-                                "minimum": 1,
-                                "maximum": 20,
-                                "default": 5,
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                ToolDefinition(
-                    name="get_schema_fields",
-                    description="Get available fields in the SOLR schema",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                ToolDefinition(
-                    name="get_collection_stats",
-                    description="Get basic statistics about the SOLR collection",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-                ToolDefinition(
-                    name="ping_solr",
-                    description="Test SOLR connection",
-                    inputSchema={"type": "object", "properties": {}},
-                ),
-            ]
-
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str, arguments: Dict[str, Any]
-        ) -> List[TextContent]:
-            """Handle tool calls."""
-            try:
-                if name == "search":
-                    return await self._handle_search(arguments)
-                elif name == "advanced_search":
-                    return await self._handle_advanced_search(arguments)
-                elif name == "faceted_search":
-                    return await self._handle_faceted_search(arguments)
-                elif name == "search_with_highlighting":
-                    return await self._handle_search_with_highlighting(arguments)
-                elif name == "get_suggestions":
-                    return await self._handle_get_suggestions(arguments)
-                elif name == "get_schema_fields":
-                    return await self._handle_get_schema_fields(arguments)
-                elif name == "get_collection_stats":
-                    return await self._handle_get_collection_stats(arguments)
-                elif name == "ping_solr":
-                    return await self._handle_ping_solr(arguments)
-                else:
-                    raise McpError(
-                        ErrorData(code=INVALID_PARAMS, message=f"Unknown tool: {name}")
-                    )
-            except SOLRClientError as e:
-                logger.error(f"SOLR error in tool {name}: {e}")
-                raise McpError(
-                    ErrorData(code=INTERNAL_ERROR, message=f"SOLR error: {str(e)}")
-                )
-            except Exception as e:
-                logger.error(f"Unexpected error in tool {name}: {e}")
-                raise McpError(
-                    ErrorData(code=INTERNAL_ERROR, message=f"Internal error: {str(e)}")
-                )
+            return list(_TOOL_DEFINITIONS)
+
+        # Arguments are validated against the precompiled validators instead.
+        self.server.call_tool(validate_input=False)(self._call_tool)
+
+    async def _call_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> List[TextContent]:
+        """
+        Handle tool calls.
+
+        Search results are served from the query cache when possible, and
+        identical searches in flight share one handler call.
+        """
+        handler = self._dispatch.get(name)
+        if handler is None:
+            raise McpError(
+                ErrorData(code=INVALID_PARAMS, message=f"Unknown tool: {name}")
+            )
+        _validate_arguments(name, arguments)
+
+        key = _query_key(name, arguments) if name in _CACHEABLE_TOOLS else None
+        if key is None:
+            return await self._call_handler(name, handler, arguments, None)
+
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Identical searches already in flight share one SOLR request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._call_handler(name, handler, arguments, key)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget_inflight, key))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(
+        self, key: Hashable, task: "asyncio.Future[List[TextContent]]"
+    ) -> None:
+        """Drop a finished search from the in-flight map."""
+        self._inflight.pop(key, None)
+        # Mark the error as retrieved, in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _call_handler(
+        self,
+        name: str,
+        handler: Callable[[Dict[str, Any]], Awaitable[List[TextContent]]],
+        arguments: Dict[str, Any],
+        key: Optional[Hashable],
+    ) -> List[TextContent]:
+        """
+        Run a tool handler, mapping failures to MCP errors.
+
+        Successful results are stored in the query cache when ``key`` is given.
+        """
+        try:
+            result = await handler(arguments)
+        except McpError:
+            raise
+        except SOLRClientError as e:
+            logger.error("SOLR error in tool %s: %s", name, e)
+            raise McpError(
+                ErrorData(code=INTERNAL_ERROR, message=f"SOLR error: {str(e)}")
+            )
+        except Exception as e:
+            logger.error("Unexpected error in tool %s: %s", name, e)
+            raise McpError(
+                ErrorData(code=INTERNAL_ERROR, message=f"Internal error: {str(e)}")
+            )
+
+        if key is not None:
+            self._query_cache.set(key, result)
+        return result
+
+    async def _run_blocking(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking SOLR client call in a worker thread.
+
+        Keeps the event loop free while waiting on SOLR. The worker pool has
+        ``max_concurrent_requests`` threads, so further calls queue until one
+        is free.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
 
     async def _handle_search(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Handle basic search requests."""
         query = arguments.get("query")
+        fields = arguments.get("fields")
         rows = arguments.get("rows", 10)
         start = arguments.get("start", 0)
 
-        if not query:
-            raise McpError(
-                ErrorData(code=INVALID_PARAMS, message="Query parameter is required")
-            )
-
-        response = self.solr_client.search(query=query, rows=rows, start=start)
-
-        result = {
-            "total_found": response.total_found,
-            "start": response.start,
-            "rows": response.rows,
-            "query_time": response.query_time,
-            "results": [
-                {"id": result.id, "score": result.score, "fields": result.fields}
-                for result in response.results
-            ],
-        }
+        response = await self._run_blocking(
+            self.solr_client.search, query=query, fields=fields, rows=rows, start=start
+        )
 
-        return [
-            TextContent(type="text", text=json.dumps(result, indent=2, default=str))
-        ]
+        return [_response_to_text(response, _SEARCH_INCLUDE, self._pretty)]
 
     async def _handle_advanced_search(
         self, arguments: Dict[str, Any]
@@ -293,12 +513,8 @@ class SOLRMCPServer:
         rows = arguments.get("rows", 10)
         start = arguments.get("start", 0)
 
-        if not query:
-            raise McpError(
-                ErrorData(code=INVALID_PARAMS, message="Query parameter is required")
-            )
-
-        response = self.solr_client.search(
+        response = await self._run_blocking(
+            self.solr_client.search,
             query=query,
             default_field=default_field,
             fields=fields,
@@ -308,20 +524,7 @@ class SOLRMCPServer:
             start=start,
         )
 
-        result = {
-            "total_found": response.total_found,
-            "start": response.start,
-            "rows": response.rows,
-            "query_time": response.query_time,
-            "results": [
-                {"id": result.id, "score": result.score, "fields": result.fields}
-                for result in response.results
-            ],
-        }
-
-        return [
-            TextContent(type="text", text=json.dumps(result, indent=2, default=str))
-        ]
+        return [_response_to_text(response, _SEARCH_INCLUDE, self._pretty)]
 
     async def _handle_faceted_search(
         self, arguments: Dict[str, Any]
@@ -332,39 +535,15 @@ class SOLRMCPServer:
         filters = arguments.get("filters")
         rows = arguments.get("rows", 10)
 
-        if not query or not facet_fields:
-            raise McpError(
-                ErrorData(
-                    code=INVALID_PARAMS,
-                    message="Query and facet_fields parameters are required",
-                )
-            )
-
-        response = self.solr_client.search(
-            query=query, filters=filters, facet_fields=facet_fields, rows=rows
+        response = await self._run_blocking(
+            self.solr_client.search,
+            query=query,
+            filters=filters,
+            facet_fields=facet_fields,
+            rows=rows,
         )
 
-        result = {
-            "total_found": response.total_found,
-            "query_time": response.query_time,
-            "facets": [
-                {
-                    "field": facet.name,
-                    "values": [
-                        {"value": fv.value, "count": fv.count} for fv in facet.values
-                    ],
-                }
-                for facet in response.facets or []
-            ],
-            "results": [
-                {"id": result.id, "score": result.score, "fields": result.fields}
-                for result in response.results
-            ],
-        }
-
-        return [
-            TextContent(type="text", text=json.dumps(result, indent=2, default=str))
-        ]
+        return [_response_to_text(response, _FACET_INCLUDE, self._pretty)]
 
     async def _handle_search_with_highlighting(
         self, arguments: Dict[str, Any]
@@ -372,37 +551,20 @@ class SOLRMCPServer:
         """Handle search with highlighting requests."""
         query = arguments.get("query")
         highlight_fields = arguments.get("highlight_fields")
+        fields = arguments.get("fields")
         rows = arguments.get("rows", 10)
         start = arguments.get("start", 0)
 
-        if not query:
-            raise McpError(
-                ErrorData(code=INVALID_PARAMS, message="Query parameter is required")
-            )
-
-        response = self.solr_client.search(
-            query=query, highlight_fields=highlight_fields, rows=rows, start=start
+        response = await self._run_blocking(
+            self.solr_client.search,
+            query=query,
+            fields=fields,
+            highlight_fields=highlight_fields,
+            rows=rows,
+            start=start,
         )
 
-        result = {
-            "total_found": response.total_found,
-            "start": response.start,
-            "rows": response.rows,
-            "query_time": response.query_time,
-            "results": [
-                {
-                    "id": result.id,
-                    "score": result.score,
-                    "fields": result.fields,
-                    "highlighting": result.highlighting,
-                }
-                for result in response.results
-            ],
-        }
-
-        return [
-            TextContent(type="text", text=json.dumps(result, indent=2, default=str))
-        ]
+        return [_response_to_text(response, _HIGHLIGHT_INCLUDE, self._pretty)]
 
     async def _handle_get_suggestions(
         self, arguments: Dict[str, Any]
@@ -411,38 +573,39 @@ class SOLRMCPServer:
         query = arguments.get("query")
         count = arguments.get("count", 5)
 
-        if not query:
-            raise McpError(
-                ErrorData(code=INVALID_PARAMS, message="Query parameter is required")
-            )
-
-        suggestions = self.solr_client.suggest_query(query, count)
+        suggestions = await self._run_blocking(
+            self.solr_client.suggest_query, query, count
+        )
 
-        return [
-            TextContent(
-                type="text", text=json.dumps({"suggestions": suggestions}, indent=2)
-            )
-        ]
+        return [_to_text({"suggestions": suggestions}, self._pretty)]
 
     async def _handle_get_schema_fields(
         self, arguments: Dict[str, Any]
     ) -> List[TextContent]:
         """Handle schema fields requests."""
-        fields = self.solr_client.get_schema_fields()
+        fields = await self._run_blocking(self.solr_client.get_schema_fields)
 
-        return [TextContent(type="text", text=json.dumps({"fields": fields}, indent=2))]
+        return [_to_text({"fields": fields}, self._pretty)]
 
     async def _handle_get_collection_stats(
         self, arguments: Dict[str, Any]
     ) -> List[TextContent]:
         """Handle collection statistics requests."""
-        stats = self.solr_client.get_collection_stats()
+        cached = self._metadata_cache.get("collection_stats")
+        if cached is not None:
+            return cached
 
-        return [TextContent(type="text", text=json.dumps(stats, indent=2))]
+        stats = await self._run_blocking(self.solr_client.get_collection_stats)
+
+        result = [_to_text(stats, self._pretty)]
+        if stats:
+            self._metadata_cache.set("collection_stats", result)
+        return result
 
     async def _handle_ping_solr(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Handle SOLR ping requests."""
-        is_healthy = self.solr_client.ping()
+        # A health check must reach SOLR, not the client's recent-ping record
+        is_healthy = await self._run_blocking(self.solr_client.ping, force=True)
 
         result = {
             "status": "healthy" if is_healthy else "unhealthy",
@@ -450,23 +613,21 @@ class SOLRMCPServer:
             "solr_url": self.config.solr.base_url,
         }
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [_to_text(result, self._pretty)]
 
     async def run(self) -> None:
         """Run the MCP server."""
         logger.info(
-            f"Starting SOLR MCP Server for collection: {self.config.solr.collection}"
+            "Starting SOLR MCP Server for collection: %s", self.config.solr.collection
         )
 
         # Test SOLR connection before starting
-        if not self.solr_client.ping():
+        if not await self._run_blocking(self.solr_client.ping, force=True):
             raise RuntimeError(
                 "Failed to connect to SOLR. Please check your configuration."
             )
 
         # Check if STDIN is available for MCP communication
-        import sys
-
         if sys.stdin.isatty():
             raise RuntimeError(
                 "This MCP server requires STDIN for communication.\n"
@@ -491,11 +652,21 @@ class SOLRMCPServer:
                 read_stream, write_stream, initialization_options, False, True
             )
 
-    def cleanup(self) -> None:
-        """Clean up resources."""
+    async def cleanup(self) -> None:
+        """
+        Clean up resources.
+
+        Safe to call more than once; only the first call closes the SOLR client.
+        """
+        if self._closed:
+            return
+        self._closed = True
         if self.solr_client:
-            self.solr_client.close()
+            # Closing the HTTP session releases pooled sockets, which may block
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self.solr_client.close)
             logger.info("SOLR MCP Server cleanup completed")
+        self._executor.shutdown(wait=False)
 
 
 async def run_server(config: Config) -> None:
@@ -505,8 +676,9 @@ async def run_server(config: Config) -> None:
     Args:
         config: Configuration object.
     """
-    server = SOLRMCPServer(config)
+    server = await SOLRMCPServer.create(config)
     try:
         await server.run()
     finally:
-        server.cleanup()
+        # Shield so a cancelled run still releases the connection pool
+        await asyncio.shield(server.cleanup())
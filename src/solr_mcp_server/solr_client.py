@@ -6,18 +6,41 @@ and other advanced SOLR features. It includes proper error handling, connection
 and result processing.
 """
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+import re
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
 import pysolr
-from pydantic import BaseModel
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .cache import TTLCache
 from .config import SOLRConfig
 
 logger = logging.getLogger(__name__)
 
 
+try:
+    import orjson
+
+    class _OrjsonDecoder:
+        """Drop-in for the json.JSONDecoder pysolr uses, backed by orjson."""
+
+        @staticmethod
+        def decode(s: str) -> Any:
+            return orjson.loads(s)
+
+    # Decoder handed to pysolr; None keeps its stdlib json default
+    _JSON_DECODER: Optional[Any] = _OrjsonDecoder()
+except ImportError:  # pragma: no cover - optional speedup
+    _JSON_DECODER = None
+
+
 class SearchResult(BaseModel):
     """Represents a single search result from SOLR."""
 
@@ -37,7 +60,8 @@ class FacetValue(BaseModel):
 class FacetField(BaseModel):
     """Represents a facet field with its values."""
 
-    name: str
+    # Serialized as "field" in tool responses
+    name: str = Field(serialization_alias="field")
     values: List[FacetValue]
 
 
@@ -49,10 +73,117 @@ class SearchResponse(BaseModel):
     start: int
     rows: int
     query_time: Optional[int] = None
-    facets: Optional[List[FacetField]] = None
+    facets: List[FacetField] = Field(default_factory=list)
     suggestions: Optional[Dict[str, List[str]]] = None
 
 
+# Response models are built from trusted SOLR data in the hot path, so skip
+# pydantic validation there.
+_new_result = SearchResult.model_construct
+_new_facet_value = FacetValue.model_construct
+_new_facet_field = FacetField.model_construct
+_new_response = SearchResponse.model_construct
+
+
+# Filter queries that can never match anything
+_MATCH_NOTHING_FILTERS = frozenset({"-*:*", "NOT *:*", "*:* NOT *:*"})
+# A single, optionally negated field:value clause, with no whitespace,
+# boolean operators, grouping, ranges or local params
+_SINGLE_CLAUSE = re.compile(r"^-?[\w.]+:[^\s()\[\]{}&|]+$").match
+
+
+@functools.lru_cache(maxsize=256)
+def _csv(values: Tuple[str, ...]) -> str:
+    """Join field names into a comma-separated list, memoized per field set."""
+    return ",".join(values)
+
+
+@functools.lru_cache(maxsize=256)
+def _field_list(fields: Tuple[str, ...]) -> str:
+    """
+    Build an fl parameter for the given fields, memoized per field set.
+
+    id and score are always included so results keep their identity and
+    ranking.
+    """
+    return _csv(("id", "score", *(f for f in fields if f not in ("id", "score"))))
+
+
+# Whether a sort specification already includes the id field
+_SORTS_BY_ID = re.compile(r"(?:^|,)\s*id\s").search
+
+
+def _is_contradictory(filters: List[str]) -> bool:
+    """
+    Check whether a list of filter queries is known to match no documents.
+
+    Detects match-nothing filters such as ``-*:*`` and a single field:value
+    clause combined with its own negation. A leading ``-`` only negates the
+    first clause of a compound filter, so those are left to SOLR, as are
+    range filters, whose bounds compare as numbers or as text depending on
+    the field type.
+    """
+    seen = set()
+    for fq in filters:
+        fq = fq.strip()
+        if fq in _MATCH_NOTHING_FILTERS:
+            return True
+        if not _SINGLE_CLAUSE(fq):
+            continue
+        negation = fq[1:] if fq.startswith("-") else f"-{fq}"
+        if negation in seen:
+            return True
+        seen.add(fq)
+    return False
+
+
+# Parameters added when spelling suggestions are requested
+_SPELLCHECK_PARAMS: Dict[str, Any] = {
+    "spellcheck": "true",
+    "spellcheck.build": "true",
+    "spellcheck.collate": "true",
+}
+
+# Retry policy shared by every client session; Retry objects are immutable
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+
+
+def _doc_to_result(
+    doc: Dict[str, Any], position: int, hl_map: Dict[str, Any]
+) -> SearchResult:
+    """
+    Convert a raw SOLR document into a SearchResult.
+
+    Args:
+        doc: Raw document from the SOLR response.
+        position: Position of the document in the result set, used to build a
+            surrogate id for documents without one.
+        hl_map: Highlighting section of the response, keyed by document id.
+    """
+    # Copy the document (a C-level copy) and pop the special fields out
+    fields = dict(doc)
+    doc_id = fields.pop("id", None)
+    if doc_id is None:
+        # Sequential surrogate, unique within the result set
+        doc_id = f"_h{position}"
+    else:
+        # model_construct skips coercion, and numeric uniqueKeys come back as
+        # ints while highlighting is always keyed by string
+        doc_id = str(doc_id)
+    score = fields.pop("score", None)
+
+    return _new_result(
+        id=doc_id,
+        score=score,
+        fields=fields,
+        highlighting=hl_map.get(doc_id) or None,
+    )
+
+
 class SOLRClientError(Exception):
     """Base exception for SOLR client errors."""
 
@@ -79,6 +210,12 @@ class SOLRClient:
     and error handling for SOLR operations.
     """
 
+    # Last successful ping per collection URL and credentials, shared by every
+    # client in the process so that building clients does not repeat a recent
+    # connection check over HTTP
+    _ping_cache: Dict[Tuple[str, Optional[Tuple[str, str]]], float] = {}
+    _ping_ttl = 5.0
+
     def __init__(self, config: SOLRConfig):
         """
         Initialize the SOLR client.
@@ -88,70 +225,91 @@ class SOLRClient:
         """
         self.config = config
         self._solr = None
+        self._session = None
+        self._collection_url = ""
+        self._auth = None
+        # SOLR has no facet count cache of its own, so keep recent facet
+        # results here. Searches run in worker threads, hence the lock.
+        self._facet_cache: TTLCache[List[FacetField]] = TTLCache(
+            maxsize=512, ttl=config.facet_cache_ttl
+        )
+        self._facet_lock = threading.Lock()
+        self._schema_cache: Optional[Tuple[float, List[str]]] = None
+        # The config is frozen, so the static request parameters can be
+        # worked out once here instead of on every search
+        self._default_rows = min(config.max_rows, 100)
+        self._facet_params: Dict[str, Any] = {
+            "facet": "true",
+            "facet.limit": config.facet_limit,
+            "facet.mincount": 1,
+        }
+        self._highlight_params: Dict[str, Any] = (
+            {
+                "hl": "true",
+                "hl.fl": "*",
+                "hl.simple.pre": "<mark>",
+                "hl.simple.post": "</mark>",
+            }
+            if config.highlight_enabled
+            else {}
+        )
         self._initialize_connection()
 
     def _initialize_connection(self) -> None:
         """Initialize the SOLR connection."""
         try:
             # Build the full URL to the collection
-            collection_url = urljoin(
-                f"{self.config.base_url}/", f"{self.config.collection}/"
-            )
+            # (base_url is validated to be absolute, without a trailing slash)
+            collection_url = f"{self.config.base_url}/{self.config.collection}/"
 
             # Set up authentication if provided
             auth = None
             if self.config.username and self.config.password:
                 auth = (self.config.username, self.config.password)
 
+            self._collection_url = collection_url
+            self._auth = auth
+            self._session = self._create_session()
             self._solr = pysolr.Solr(
                 collection_url,
                 auth=auth,
                 timeout=self.config.timeout,
                 verify=self.config.verify_ssl,
+                decoder=_JSON_DECODER,
                 # Add connection pooling and keep-alive
-                session=self._create_session(),
+                session=self._session,
             )
 
-            # Test the connection with retry
-            self._ping_with_retry()
+            # Test the connection with retry, unless it was recently checked
+            if not self._recently_pinged():
+                self._ping_with_retry()
+                self._ping_cache[self._ping_key] = time.monotonic()
             logger.info(f"Successfully connected to SOLR at {collection_url}")
 
         except Exception as e:
             logger.error(f"Failed to connect to SOLR: {e}")
             raise SOLRConnectionError(f"Failed to connect to SOLR: {e}")
 
-    def _create_session(self):
+    def _create_session(self) -> requests.Session:
         """Create a requests session with connection pooling."""
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-
-        # Configure connection adapter with pooling
+        # One pooled adapter serves both schemes
         adapter = HTTPAdapter(
-            max_retries=retry_strategy, pool_connections=10, pool_maxsize=20
+            max_retries=_RETRY,
+            pool_connections=10,
+            pool_maxsize=self.config.max_connections,
         )
-
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         # Set keep-alive
-        session.headers.update({"Connection": "keep-alive"})
+        session.headers["Connection"] = "keep-alive"
 
         return session
 
     def _ping_with_retry(self, max_retries: int = 3) -> None:
         """Ping SOLR with retry logic."""
-        import time
-
         for attempt in range(max_retries):
             try:
                 self._solr.ping()
@@ -164,18 +322,36 @@ class SOLRClient:
                 )
                 time.sleep(0.5 * (attempt + 1))  # Progressive backoff
 
-    def ping(self) -> bool:
+    @property
+    def _ping_key(self) -> Tuple[str, Optional[Tuple[str, str]]]:
+        """Key for this client's connection in the shared ping cache."""
+        return (self._collection_url, self._auth)
+
+    def _recently_pinged(self) -> bool:
+        """Check whether SOLR answered a ping within the last few seconds."""
+        last_ok = self._ping_cache.get(self._ping_key)
+        return last_ok is not None and time.monotonic() - last_ok < self._ping_ttl
+
+    def ping(self, force: bool = False) -> bool:
         """
         Test the SOLR connection.
 
+        Args:
+            force: Ping SOLR even if a recent ping already succeeded.
+
         Returns:
             True if the connection is successful, False otherwise.
         """
+        if not self._solr:
+            return False
+        if not force and self._recently_pinged():
+            return True
         try:
-            if self._solr:
-                self._solr.ping()
-                return True
+            self._solr.ping()
+            self._ping_cache[self._ping_key] = time.monotonic()
+            return True
         except Exception as e:
+            self._ping_cache.pop(self._ping_key, None)
             logger.warning(f"SOLR ping failed: {e}")
         return False
 
@@ -216,9 +392,13 @@ class SOLRClient:
             SOLRQueryError: If the query fails.
         """
         try:
+            if filters and _is_contradictory(filters):
+                logger.debug("Skipping search with contradictory filters: %s", filters)
+                return SearchResponse(results=[], total_found=0, start=start, rows=0)
+
             if rows is None:
                 # Default to 100 if not specified
-                rows = min(self.config.max_rows, 100)
+                rows = self._default_rows
 
             # Build search parameters
             search_params = {"q": query, "start": start, "rows": rows, **kwargs}
@@ -229,7 +409,7 @@ class SOLRClient:
 
             # Add field list if specified
             if fields:
-                search_params["fl"] = ",".join(fields)
+                search_params["fl"] = _field_list(tuple(fields))
 
             # Add sort if specified
             if sort:
@@ -239,45 +419,123 @@ class SOLRClient:
             if filters:
                 search_params["fq"] = filters
 
-            # Add faceting
-            if facet_fields:
-                search_params["facet"] = "true"
+            # Add faceting, unless the counts for this query are cached
+            facet_key: Optional[Hashable] = None
+            cached_facets: Optional[List[FacetField]] = None
+            if facet_fields and not kwargs:
+                facet_key = (
+                    query,
+                    default_field,
+                    tuple(sorted(filters or ())),
+                    # Facets come back in the requested order, so keep it
+                    tuple(facet_fields),
+                    self.config.facet_limit,
+                )
+                with self._facet_lock:
+                    cached_facets = self._facet_cache.get(facet_key)
+
+            if facet_fields and cached_facets is None:
+                search_params.update(self._facet_params)
                 search_params["facet.field"] = facet_fields
-                search_params["facet.limit"] = self.config.facet_limit
-                search_params["facet.mincount"] = 1
-
-            # Add highlighting
-            if highlight_fields and self.config.highlight_enabled:
-                search_params["hl"] = "true"
-                search_params["hl.fl"] = ",".join(highlight_fields)
-                search_params["hl.simple.pre"] = "<mark>"
-                search_params["hl.simple.post"] = "</mark>"
-            elif self.config.highlight_enabled and not highlight_fields:
-                # Enable highlighting on all fields if no specific fields requested
-                search_params["hl"] = "true"
-                search_params["hl.fl"] = "*"
-                search_params["hl.simple.pre"] = "<mark>"
-                search_params["hl.simple.post"] = "</mark>"
+
+            # Add highlighting, on all fields if no specific fields requested
+            if self._highlight_params:
+                search_params.update(self._highlight_params)
+                if highlight_fields:
+                    search_params["hl.fl"] = _csv(tuple(highlight_fields))
 
             # Add suggestions
             if suggest:
-                search_params["spellcheck"] = "true"
-                search_params["spellcheck.build"] = "true"
-                search_params["spellcheck.collate"] = "true"
+                search_params.update(_SPELLCHECK_PARAMS)
 
-            logger.debug(f"Executing SOLR search with params: {search_params}")
+            logger.debug("Executing SOLR search with params: %s", search_params)
 
             # Execute the search
             response = self._solr.search(**search_params)
 
-            return self._process_search_response(response)
+            result = self._process_search_response(response)
+            if cached_facets is not None:
+                result.facets = list(cached_facets)
+            elif facet_key is not None:
+                with self._facet_lock:
+                    self._facet_cache.set(facet_key, list(result.facets))
+            return result
 
-        except pysolr.SolrError as e:
-            logger.error(f"SOLR query error: {e}")
+        except (pysolr.SolrError, requests.RequestException) as e:
+            logger.error("SOLR query failed: %s", e)
             raise SOLRQueryError(f"SOLR query failed: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error during search: {e}")
-            raise SOLRQueryError(f"Unexpected error during search: {e}")
+
+    def iter_search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        batch_size: int = 100,
+        **kwargs: Any,
+    ) -> Iterator[SearchResult]:
+        """
+        Iterate over every result of a query using cursorMark deep paging.
+
+        Only one page of ``batch_size`` documents is held in memory at a
+        time, so arbitrarily large result sets can be walked without loading
+        them all at once.
+
+        Args:
+            query: The search query string.
+            fields: List of fields to return. If None, returns all fields.
+            filters: List of filter queries (fq parameters).
+            sort: Sort specification. The id field is appended as a tie-breaker,
+                as cursorMark requires the sort to include the unique key.
+            batch_size: Number of documents fetched per request.
+            **kwargs: Additional SOLR parameters.
+
+        Yields:
+            SearchResult objects in sort order.
+
+        Raises:
+            SOLRQueryError: If a query fails.
+        """
+        if not sort:
+            sort = "score desc,id asc"
+        elif not _SORTS_BY_ID(sort):
+            sort = f"{sort},id asc"
+
+        search_params: Dict[str, Any] = {
+            "q": query,
+            "rows": batch_size,
+            "sort": sort,
+            **kwargs,
+        }
+        if fields:
+            search_params["fl"] = _field_list(tuple(fields))
+        if filters:
+            search_params["fq"] = filters
+
+        cursor = "*"
+        position = 0
+        while True:
+            try:
+                response = self._solr.search(cursorMark=cursor, **search_params)
+            except (pysolr.SolrError, requests.RequestException) as e:
+                logger.error("SOLR query failed: %s", e)
+                raise SOLRQueryError(f"SOLR query failed: {e}")
+
+            hl_map = getattr(response, "highlighting", None) or {}
+            for doc in response.docs:
+                yield _doc_to_result(doc, position, hl_map)
+                position += 1
+
+            # SOLR returns the same cursor once the results are exhausted
+            next_cursor = getattr(response, "nextCursorMark", None)
+            if not next_cursor or next_cursor == cursor:
+                return
+            cursor = next_cursor
+
+    def invalidate_facets(self) -> None:
+        """Drop all cached facet counts, e.g. after the index has changed."""
+        with self._facet_lock:
+            self._facet_cache.clear()
 
     def suggest_query(self, query: str, count: int = 5) -> Dict[str, List[str]]:
         """
@@ -320,12 +578,31 @@ class SOLRClient:
         """
         Get the list of available fields in the SOLR schema.
 
+        The result is cached on the client for ``schema_cache_ttl`` seconds.
+
         Returns:
             List of field names.
         """
+        if self._schema_cache is not None:
+            cached_at, fields = self._schema_cache
+            if time.monotonic() - cached_at < self.config.schema_cache_ttl:
+                return list(fields)
+
+        fields = self._load_schema_fields()
+        # An empty list means the lookup failed, so don't hold on to it
+        if fields:
+            self._schema_cache = (time.monotonic(), fields)
+        return list(fields)
+
+    def _load_schema_fields(self) -> List[str]:
+        """Get the schema fields from SOLR, falling back to a sample document."""
+        try:
+            return self._fetch_schema_fields()
+        except Exception as e:
+            logger.debug("Schema API unavailable, sampling a document: %s", e)
+
         try:
-            # This is a simplified approach - in a real implementation,
-            # you might want to use the Schema API
+            # Fall back to the fields of a stored document
             response = self._solr.search("*:*", rows=1, fl="*")
             if response.docs:
                 return list(response.docs[0].keys())
@@ -334,6 +611,18 @@ class SOLRClient:
             logger.warning(f"Failed to get schema fields: {e}")
             return []
 
+    def _fetch_schema_fields(self) -> List[str]:
+        """Get the field names from the SOLR Schema API."""
+        response = self._session.get(
+            f"{self._collection_url}schema/fields",
+            params={"wt": "json"},
+            auth=self._auth,
+            timeout=self.config.timeout,
+            verify=self.config.verify_ssl,
+        )
+        response.raise_for_status()
+        return [field["name"] for field in response.json()["fields"]]
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """
         Get basic statistics about the collection.
@@ -363,50 +652,39 @@ class SOLRClient:
             Processed SearchResponse object.
         """
         results = []
+        # Look up the optional response sections once rather than per document
+        hl_map = getattr(response, "highlighting", None) or {}
+        facet_data = getattr(response, "facets", None) or {}
+        spellcheck = getattr(response, "spellcheck", None) or {}
 
         # Process documents
-        for doc in response.docs:
-            doc_id = doc.get("id", str(hash(str(doc))))
-            score = doc.get("score")
-
-            # Remove special fields from the fields dict
-            fields = {k: v for k, v in doc.items() if k not in ["id", "score"]}
-
-            # Get highlighting for this document
-            highlighting = None
-            if hasattr(response, "highlighting") and response.highlighting:
-                doc_highlighting = response.highlighting.get(doc_id, {})
-                if doc_highlighting:
-                    highlighting = doc_highlighting
-
-            results.append(
-                SearchResult(
-                    id=doc_id, score=score, fields=fields, highlighting=highlighting
-                )
-            )
+        for position, doc in enumerate(response.docs):
+            results.append(_doc_to_result(doc, position, hl_map))
 
         # Process facets
         facets = []
-        if hasattr(response, "facets") and response.facets:
-            facet_fields = response.facets.get("facet_fields", {})
+        if facet_data:
+            facet_fields = facet_data.get("facet_fields", {})
             for field_name, field_values in facet_fields.items():
-                facet_values = []
-                # SOLR returns facet values as [value1, count1, value2, count2, ...]
-                for i in range(0, len(field_values), 2):
-                    if i + 1 < len(field_values):
-                        facet_values.append(
-                            FacetValue(
-                                value=str(field_values[i]), count=field_values[i + 1]
-                            )
-                        )
+                # SOLR returns facet values as [value1, count1, value2, count2, ...];
+                # zip drops a trailing unpaired value
+                facet_values = [
+                    _new_facet_value(
+                        value=value if isinstance(value, str) else str(value),
+                        count=count,
+                    )
+                    for value, count in zip(field_values[0::2], field_values[1::2])
+                ]
 
                 if facet_values:
-                    facets.append(FacetField(name=field_name, values=facet_values))
+                    facets.append(
+                        _new_facet_field(name=field_name, values=facet_values)
+                    )
 
         # Process spelling suggestions
         suggestions = {}
-        if hasattr(response, "spellcheck") and response.spellcheck:
-            spellcheck_data = response.spellcheck.get("suggestions", {})
+        if spellcheck:
+            spellcheck_data = spellcheck.get("suggestions", {})
             for word, suggestion_data in spellcheck_data.items():
                 if (
                     isinstance(suggestion_data, dict)
@@ -414,20 +692,24 @@ class SOLRClient:
                 ):
                     suggestions[word] = suggestion_data["suggestion"]
 
-        return SearchResponse(
+        return _new_response(
             results=results,
             total_found=response.hits,
             start=getattr(response, "start", 0),
             rows=len(results),
             query_time=getattr(response, "qtime", None),
-            facets=facets if facets else None,
+            facets=facets,
             suggestions=suggestions if suggestions else None,
         )
 
     def close(self) -> None:
         """Close the SOLR connection."""
         if self._solr:
-            # pysolr doesn't have an explicit close method, but we can clean up
+            # pysolr doesn't have an explicit close method, so close the
+            # session we gave it to release pooled connections
+            if self._session is not None:
+                self._session.close()
+                self._session = None
             self._solr = None
             logger.info("SOLR connection closed")
 
@@ -7,7 +7,13 @@ from pathlib import Path
 import tempfile
 import os
 
-from solr_mcp_server.config import Config, SOLRConfig, MCPConfig
+from solr_mcp_server.config import (
+    _ENV_VARS,
+    Config,
+    SOLRConfig,
+    MCPConfig,
+    get_config,
+)
 
 
 @pytest.fixture
@@ -109,33 +115,19 @@ def clean_env_vars():
     """Clean up environment variables before and after each test."""
     # Store original environment variables
     original_env = {}
-    env_vars_to_clean = [
-        "SOLR_BASE_URL",
-        "SOLR_COLLECTION",
-        "SOLR_USERNAME",
-        "SOLR_PASSWORD",
-        "SOLR_TIMEOUT",
-        "SOLR_VERIFY_SSL",
-        "SOLR_MAX_ROWS",
-        "SOLR_DEFAULT_SEARCH_FIELD",
-        "SOLR_FACET_LIMIT",
-        "SOLR_HIGHLIGHT_ENABLED",
-        "MCP_SERVER_HOST",
-        "MCP_SERVER_PORT",
-        "LOG_LEVEL",
-        "OLLAMA_BASE_URL",
-        "OLLAMA_MODEL",
-    ]
-
-    for var in env_vars_to_clean:
+    for var in _ENV_VARS:
         if var in os.environ:
             original_env[var] = os.environ[var]
         os.environ.pop(var, None)
 
+    get_config.cache_clear()
+
     yield
 
+    get_config.cache_clear()
+
     # Restore original environment variables
-    for var in env_vars_to_clean:
+    for var in _ENV_VARS:
         os.environ.pop(var, None)
 
     for var, value in original_env.items():
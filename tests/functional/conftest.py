@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the functional tests.
+
+These tests need a running SOLR instance, configured through the
+SOLR_TEST_URL and SOLR_TEST_COLLECTION environment variables.
+"""
+
+import os
+
+import pytest
+
+from solr_mcp_server.config import Config, MCPConfig, SOLRConfig
+from solr_mcp_server.server import SOLRMCPServer
+from solr_mcp_server.solr_client import SOLRClient, SOLRConnectionError
+
+
+@pytest.fixture(scope="session", autouse=True)
+def check_solr_available():
+    """Skip the functional tests if SOLR is not available, checking only once."""
+    solr_url = os.getenv("SOLR_TEST_URL")
+    collection = os.getenv("SOLR_TEST_COLLECTION")
+
+    if not solr_url or not collection:
+        pytest.skip(
+            "Functional tests require SOLR_TEST_URL and SOLR_TEST_COLLECTION environment variables"
+        )
+
+    # Try to create a client and ping SOLR, failing fast if it is down
+    config = SOLRConfig(base_url=solr_url, collection=collection, timeout=2)
+    try:
+        client = SOLRClient(config)
+        try:
+            # Bypass the recent-ping record, which may predate an outage
+            responding = client.ping(force=True)
+        finally:
+            client.close()
+    except SOLRConnectionError:
+        pytest.skip("Cannot connect to SOLR instance")
+
+    if not responding:
+        pytest.skip("SOLR instance is not responding")
+
+
+@pytest.fixture(scope="session")
+def integration_config():
+    """Configuration for integration tests."""
+    solr_config = SOLRConfig(
+        base_url=os.getenv("SOLR_TEST_URL"),
+        collection=os.getenv("SOLR_TEST_COLLECTION"),
+        timeout=10,
+        verify_ssl=False,
+    )
+    mcp_config = MCPConfig(log_level="DEBUG")
+    return Config(solr=solr_config, mcp=mcp_config)
+
+
+@pytest.fixture(scope="session")
+def solr_client(integration_config):
+    """One SOLR client, and its pooled session, shared by every test."""
+    client = SOLRClient(integration_config.solr)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+async def mcp_server(integration_config):
+    """One MCP server, and its pooled SOLR session, shared by every test."""
+    server = SOLRMCPServer(integration_config)
+    yield server
+    await server.cleanup()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the in-process TTL cache.
+"""
+
+from unittest.mock import patch
+
+from solr_mcp_server.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_set(self):
+        """Test storing and retrieving a value."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("a") is None
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert "a" in cache
+        assert len(cache) == 1
+
+    def test_entries_expire(self):
+        """Test that entries are dropped once their TTL has passed."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("solr_mcp_server.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=30)
+        with patch("solr_mcp_server.cache.time.monotonic", return_value=115.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+        assert len(cache) == 1
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction when the cache is full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of zero stores nothing."""
+        cache = TTLCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Test removing all entries."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.clear()
+        assert len(cache) == 0
@@ -2,9 +2,11 @@
 Unit tests for the configuration module.
 """
 
+import io
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -48,39 +50,33 @@ class TestSOLRConfig:
         with pytest.raises(ValidationError):
             SOLRConfig(base_url="ftp://localhost:8983/solr", collection="test")
 
-    def test_solr_config_timeout_validation(self):
-        """Test timeout validation."""
-        # Test negative timeout
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("timeout", -1),
+            ("timeout", 0),
+            ("max_rows", -1),
+            ("max_rows", 0),
+            ("max_rows", 20000),
+            ("max_concurrent_requests", 0),
+            ("max_connections", 0),
+            ("max_connections", 10001),
+            ("stats_cache_ttl", -1),
+        ],
+    )
+    def test_solr_config_invalid_values(self, field, value):
+        """Test that out-of-range SOLR settings are rejected."""
         with pytest.raises(ValidationError):
             SOLRConfig(
-                base_url="http://localhost:8983/solr", collection="test", timeout=-1
+                base_url="http://localhost:8983/solr",
+                collection="test",
+                **{field: value},
             )
 
-        # Test zero timeout
-        with pytest.raises(ValidationError):
-            SOLRConfig(
-                base_url="http://localhost:8983/solr", collection="test", timeout=0
-            )
-
-    def test_solr_config_max_rows_validation(self):
-        """Test max_rows validation."""
-        # Test negative max_rows
-        with pytest.raises(ValidationError):
-            SOLRConfig(
-                base_url="http://localhost:8983/solr", collection="test", max_rows=-1
-            )
-
-        # Test zero max_rows
-        with pytest.raises(ValidationError):
-            SOLRConfig(
-                base_url="http://localhost:8983/solr", collection="test", max_rows=0
-            )
-
-        # Test excessive max_rows
-        with pytest.raises(ValidationError):
-            SOLRConfig(
-                base_url="http://localhost:8983/solr", collection="test", max_rows=20000
-            )
+    def test_solr_config_cache_ttl_zero(self):
+        """Test that a zero cache TTL is allowed, disabling the cache."""
+        config = SOLRConfig(collection="test", schema_cache_ttl=0)
+        assert config.schema_cache_ttl == 0
 
 
 class TestMCPConfig:
@@ -93,32 +89,34 @@ class TestMCPConfig:
         assert config.port == 8080
         assert config.log_level == "DEBUG"
 
-    def test_mcp_config_port_validation(self):
-        """Test port validation."""
-        # Test invalid port ranges
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("port", 0),
+            ("port", 65536),
+            ("port", -1),
+            ("log_level", "INVALID"),
+        ],
+    )
+    def test_mcp_config_invalid_values(self, field, value):
+        """Test that out-of-range MCP settings are rejected."""
         with pytest.raises(ValidationError):
-            MCPConfig(port=0)
-
-        with pytest.raises(ValidationError):
-            MCPConfig(port=65536)
-
-        with pytest.raises(ValidationError):
-            MCPConfig(port=-1)
-
-    def test_mcp_config_log_level_validation(self):
-        """Test log level validation."""
-        # Test valid log levels
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            config = MCPConfig(log_level=level)
-            assert config.log_level == level
-
-        # Test case insensitive
-        config = MCPConfig(log_level="debug")
-        assert config.log_level == "DEBUG"
-
-        # Test invalid log level
-        with pytest.raises(ValidationError):
-            MCPConfig(log_level="INVALID")
+            MCPConfig(**{field: value})
+
+    @pytest.mark.parametrize(
+        "level,expected",
+        [
+            ("DEBUG", "DEBUG"),
+            ("INFO", "INFO"),
+            ("WARNING", "WARNING"),
+            ("ERROR", "ERROR"),
+            ("CRITICAL", "CRITICAL"),
+            ("debug", "DEBUG"),
+        ],
+    )
+    def test_mcp_config_log_level(self, level, expected):
+        """Test that valid log levels are accepted case-insensitively."""
+        assert MCPConfig(log_level=level).log_level == expected
 
 
 class TestOllamaConfig:
@@ -168,6 +166,15 @@ class TestConfig:
         assert config.ollama.base_url == "http://localhost:11434"
         assert config.ollama.model == "llama2"
 
+    def test_config_is_frozen(self):
+        """Test that configuration cannot be mutated after creation."""
+        config = Config(
+            solr=SOLRConfig(base_url="http://localhost:8983/solr", collection="test")
+        )
+
+        with pytest.raises(ValidationError):
+            config.solr.collection = "other"
+
 
 class TestConfigFromEnv:
     """Test cases for loading config from environment variables."""
@@ -191,6 +198,7 @@ class TestConfigFromEnv:
         monkeypatch.setenv("MCP_SERVER_HOST", "0.0.0.0")
         monkeypatch.setenv("MCP_SERVER_PORT", "9090")
         monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("MCP_PRETTY_JSON", "true")
         monkeypatch.setenv("OLLAMA_BASE_URL", "http://localhost:11434")
         monkeypatch.setenv("OLLAMA_MODEL", "llama3")
 
@@ -205,6 +213,7 @@ class TestConfigFromEnv:
         assert config.mcp.host == "0.0.0.0"
         assert config.mcp.port == 9090
         assert config.mcp.log_level == "DEBUG"
+        assert config.mcp.pretty_json is True
         assert config.ollama is not None
         assert config.ollama.base_url == "http://localhost:11434"
         assert config.ollama.model == "llama3"
@@ -219,9 +228,8 @@ class TestConfigFromEnv:
         ):
             Config.from_env()
 
-    def test_config_from_env_file(self, tmp_path):
-        """Test loading config from .env file."""
-        env_file = tmp_path / ".env"
+    def test_config_from_env_file(self):
+        """Test loading config from .env contents."""
         env_content = """
 SOLR_BASE_URL=http://test.example.com:8983/solr
 SOLR_COLLECTION=env_test_collection
@@ -230,9 +238,7 @@ SOLR_PASSWORD=env_pass
 MCP_SERVER_PORT=7070
 LOG_LEVEL=WARNING
         """
-        env_file.write_text(env_content.strip())
-
-        config = Config.from_env(env_file)
+        config = Config.from_env(io.StringIO(env_content.strip()))
 
         assert config.solr.base_url == "http://test.example.com:8983/solr"
         assert config.solr.collection == "env_test_collection"
@@ -241,6 +247,23 @@ LOG_LEVEL=WARNING
         assert config.mcp.port == 7070
         assert config.mcp.log_level == "WARNING"
 
+    def test_config_from_env_skips_file_when_env_complete(self, tmp_path, monkeypatch):
+        """Test that the .env file is not parsed when every variable is set."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SOLR_COLLECTION=from_file")
+
+        monkeypatch.setattr(
+            "solr_mcp_server.config._ENV_VARS", ("SOLR_COLLECTION", "LOG_LEVEL")
+        )
+        monkeypatch.setenv("SOLR_COLLECTION", "from_env")
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+
+        with patch("solr_mcp_server.config.load_dotenv") as mock_load_dotenv:
+            config = Config.from_env(env_file)
+
+        mock_load_dotenv.assert_not_called()
+        assert config.solr.collection == "from_env"
+
     def test_config_from_nonexistent_env_file(self, tmp_path):
         """Test loading config when .env file doesn't exist."""
         nonexistent_file = tmp_path / "nonexistent.env"
@@ -261,6 +284,32 @@ LOG_LEVEL=WARNING
         config = get_config()
         assert config.solr.collection == "convenience_test"
 
+    def test_get_config_is_cached(self, monkeypatch):
+        """Test that get_config reuses the loaded configuration."""
+        monkeypatch.setenv("SOLR_COLLECTION", "cached_test")
+
+        config = get_config()
+        assert get_config() is config
+
+        # A changed environment is picked up without clearing the cache
+        monkeypatch.setenv("SOLR_COLLECTION", "changed")
+        assert get_config().solr.collection == "changed"
+
+        monkeypatch.setenv("SOLR_COLLECTION", "cached_test")
+        assert get_config() is config
+
+    def test_get_config_is_cached_after_loading_env_file(self, tmp_path):
+        """Test that a config loaded from a .env file is reused on the next call."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SOLR_COLLECTION=from_file")
+
+        with patch.object(Config, "from_env", wraps=Config.from_env) as mock_from_env:
+            config = get_config(env_file)
+            assert get_config(env_file) is config
+
+        mock_from_env.assert_called_once()
+        assert config.solr.collection == "from_file"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,68 @@
+"""
+Unit tests for the search result models.
+"""
+
+import pytest
+
+from solr_mcp_server.solr_client import (
+    FacetField,
+    FacetValue,
+    SearchResponse,
+    SearchResult,
+)
+
+
+class TestSearchResultModels:
+    """Test cases for search result models."""
+
+    def test_search_response_creation(self):
+        """Test SearchResponse creation with nested results and facets."""
+        results = [
+            SearchResult(
+                id="doc1",
+                score=1.5,
+                fields={"title": "Test", "content": "Content"},
+                highlighting={"title": ["<mark>Test</mark>"]},
+            )
+        ]
+        facets = [
+            FacetField(
+                name="category",
+                values=[
+                    FacetValue(value="books", count=5),
+                    FacetValue(value="articles", count=3),
+                ],
+            )
+        ]
+
+        response = SearchResponse(
+            results=results,
+            total_found=1,
+            start=0,
+            rows=1,
+            query_time=15,
+            facets=facets,
+            suggestions={"test": ["tests", "testing"]},
+        )
+
+        assert response.total_found == 1
+        assert response.query_time == 15
+        assert "test" in response.suggestions
+
+        assert len(response.results) == 1
+        result = response.results[0]
+        assert result.id == "doc1"
+        assert result.score == 1.5
+        assert result.fields["title"] == "Test"
+        assert result.highlighting["title"] == ["<mark>Test</mark>"]
+
+        assert len(response.facets) == 1
+        facet_field = response.facets[0]
+        assert facet_field.name == "category"
+        assert len(facet_field.values) == 2
+        assert facet_field.values[0].value == "books"
+        assert facet_field.values[0].count == 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
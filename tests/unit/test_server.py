@@ -0,0 +1,226 @@
+"""
+Unit tests for the MCP server module.
+"""
+
+import asyncio
+import gc
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from mcp import McpError
+from mcp.types import INVALID_PARAMS, CallToolRequest, CallToolRequestParams
+
+from solr_mcp_server.server import SOLRMCPServer, _validate_arguments
+from solr_mcp_server.solr_client import SearchResponse, SOLRClient, SOLRClientError
+
+
+@pytest.fixture
+def mock_client():
+    """Fixture providing a mock SOLR client returning an empty result."""
+    client = Mock(spec=SOLRClient)
+    client.search.return_value = SearchResponse(
+        results=[], total_found=0, start=0, rows=10, query_time=1
+    )
+    return client
+
+
+@pytest.fixture
+def make_server(mock_client):
+    """Factory fixture building servers wired to ``mock_client``."""
+    servers = []
+
+    def _make_server(config):
+        with patch("solr_mcp_server.server.SOLRClient", return_value=mock_client):
+            servers.append(SOLRMCPServer(config))
+        return servers[-1]
+
+    yield _make_server
+    for server in servers:
+        server._executor.shutdown(wait=False)
+
+
+@pytest.fixture
+def server(make_server, test_config):
+    """Fixture providing a server wired to ``mock_client``."""
+    return make_server(test_config)
+
+
+@pytest.fixture
+def uncached_server(make_server, test_config):
+    """Fixture providing a server with the query cache turned off."""
+    solr_config = test_config.solr.model_copy(update={"query_cache_ttl": 0})
+    return make_server(test_config.model_copy(update={"solr": solr_config}))
+
+
+async def call_tool(server, name, arguments):
+    """Call a tool through the MCP server's CallToolRequest handler."""
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await server.server.request_handlers[CallToolRequest](request)
+    return result.root
+
+
+class TestArgumentValidation:
+    """Test cases for tool argument validation."""
+
+    @pytest.mark.parametrize(
+        "name,arguments",
+        [
+            ("search", {}),
+            ("search", {"query": ""}),
+            ("search", {"query": "test", "rows": 0}),
+            ("faceted_search", {"query": "test"}),
+            ("faceted_search", {"query": "test", "facet_fields": []}),
+            ("get_suggestions", {"query": ""}),
+        ],
+    )
+    def test_invalid_arguments(self, name, arguments):
+        """Test that invalid arguments are rejected with INVALID_PARAMS."""
+        with pytest.raises(McpError) as excinfo:
+            _validate_arguments(name, arguments)
+
+        assert excinfo.value.error.code == INVALID_PARAMS
+        assert excinfo.value.error.message.startswith(f"Invalid arguments for {name}")
+
+    async def test_invalid_arguments_do_not_reach_solr(self, server, mock_client):
+        """Test that the tool call handler rejects arguments before SOLR."""
+        result = await call_tool(
+            server, "faceted_search", {"query": "test", "facet_fields": []}
+        )
+
+        assert result.isError is True
+        assert "Invalid arguments for faceted_search" in result.content[0].text
+        mock_client.search.assert_not_called()
+
+    async def test_valid_arguments_reach_solr(self, server, mock_client):
+        """Test that valid arguments are passed on to SOLR."""
+        result = await call_tool(server, "search", {"query": "test"})
+
+        assert result.isError is False
+        mock_client.search.assert_called_once()
+
+
+class TestPingTool:
+    """Test cases for the ping_solr tool."""
+
+    async def test_ping_always_reaches_solr(self, server, mock_client):
+        """Test that the health check bypasses the client's recent-ping record."""
+        mock_client.ping.return_value = True
+
+        result = await call_tool(server, "ping_solr", {})
+
+        assert result.isError is False
+        assert '"healthy"' in result.content[0].text
+        mock_client.ping.assert_called_once_with(force=True)
+
+
+class TestMetadataTools:
+    """Test cases for the schema and stats tools."""
+
+    async def test_schema_fields_are_cached_by_the_client_only(
+        self, server, mock_client
+    ):
+        """Test that the server leaves schema field caching to the client."""
+        mock_client.get_schema_fields.return_value = ["id", "title"]
+
+        await call_tool(server, "get_schema_fields", {})
+        result = await call_tool(server, "get_schema_fields", {})
+
+        assert '"title"' in result.content[0].text
+        assert mock_client.get_schema_fields.call_count == 2
+
+
+class TestToolCalls:
+    """Test cases for tool dispatch, caching and coalescing."""
+
+    async def test_unknown_tool(self, server):
+        """Test that unknown tools are rejected with INVALID_PARAMS."""
+        with pytest.raises(McpError) as excinfo:
+            await server._call_tool("no_such_tool", {})
+
+        assert excinfo.value.error.code == INVALID_PARAMS
+        assert excinfo.value.error.message == "Unknown tool: no_such_tool"
+
+    async def test_concurrent_identical_searches_share_one_call(
+        self, uncached_server, mock_client
+    ):
+        """Test that identical searches in flight make a single SOLR call."""
+        # The query cache is off, so only coalescing can save the second call
+        first, second = await asyncio.gather(
+            uncached_server._call_tool("search", {"query": "test"}),
+            uncached_server._call_tool("search", {"query": "test"}),
+        )
+
+        assert first is second
+        mock_client.search.assert_called_once()
+        assert uncached_server._inflight == {}
+
+    async def test_failed_search_with_no_waiters_is_retrieved(
+        self, uncached_server, mock_client
+    ):
+        """Test that a search failing after its only caller left logs nothing."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def search(**kwargs):
+            started.set()
+            release.wait()
+            raise SOLRClientError("boom")
+
+        mock_client.search.side_effect = search
+        loop = asyncio.get_running_loop()
+        errors = []
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            caller = asyncio.ensure_future(
+                uncached_server._call_tool("search", {"query": "test"})
+            )
+            await loop.run_in_executor(None, started.wait)
+            (task,) = uncached_server._inflight.values()
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+
+            release.set()
+            await asyncio.wait([task])
+            del task, caller
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert errors == []
+        assert uncached_server._inflight == {}
+
+    async def test_query_cache(self, server, mock_client):
+        """Test that repeated searches are served from the query cache."""
+        first = await server._call_tool("search", {"query": "test"})
+        second = await server._call_tool("search", {"query": "test"})
+        assert second is first
+        mock_client.search.assert_called_once()
+
+        # Different arguments miss the cache
+        await server._call_tool("search", {"query": "test", "rows": 5})
+        assert mock_client.search.call_count == 2
+
+    async def test_query_cache_disabled(self, uncached_server, mock_client):
+        """Test that a query cache TTL of zero sends every search to SOLR."""
+        await uncached_server._call_tool("search", {"query": "test"})
+        await uncached_server._call_tool("search", {"query": "test"})
+
+        assert mock_client.search.call_count == 2
+
+    async def test_cleanup_is_idempotent(self, server, mock_client):
+        """Test that a second cleanup does nothing."""
+        await server.cleanup()
+        await server.cleanup()
+
+        mock_client.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -2,27 +2,40 @@
 Unit tests for the SOLR client module.
 """
 
+import re
+
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 import pysolr
+import requests
 
 from solr_mcp_server.config import SOLRConfig
 from solr_mcp_server.solr_client import (
+    _JSON_DECODER,
+    _is_contradictory,
     SOLRClient,
     SOLRClientError,
     SOLRConnectionError,
     SOLRQueryError,
-    SearchResult,
-    SearchResponse,
-    FacetField,
-    FacetValue,
 )
 
+# Expected error messages, compiled once rather than on every pytest.raises
+_RE_CONNECT_FAILED = re.compile("Failed to connect to SOLR")
+_RE_QUERY_FAILED = re.compile("SOLR query failed")
+_RE_CONNECTION_RESET = re.compile("Connection reset")
+_RE_UNEXPECTED = re.compile("Unexpected error")
 
-@pytest.fixture
+# Attribute names of the real pysolr.Solr, introspected once at import, before
+# the class-scoped patched_solr_class fixture swaps it for an autospec, rather
+# than by every spec'd Mock
+_SOLR_SPEC = dir(pysolr.Solr)
+
+
+@pytest.fixture(scope="session")
 def solr_config():
-    """Fixture providing a basic SOLR configuration."""
+    """Fixture providing a basic SOLR configuration, shared by every test."""
     return SOLRConfig(
         base_url="http://localhost:8983/solr",
         collection="test_collection",
@@ -34,21 +47,68 @@ def solr_config():
 @pytest.fixture
 def mock_solr():
     """Fixture providing a mock SOLR instance."""
-    mock = Mock(spec=pysolr.Solr)
+    mock = Mock(spec=_SOLR_SPEC)
     mock.ping.return_value = True
     return mock
 
 
+@pytest.fixture
+def make_response():
+    """Factory fixture building stand-in SOLR results with empty defaults."""
+
+    # The client only reads attributes of a result, so a plain namespace
+    # is enough and much cheaper than a Mock
+    def _make_response(**overrides):
+        return SimpleNamespace(
+            **{
+                "docs": [],
+                "hits": 0,
+                "start": 0,
+                "qtime": 0,
+                "highlighting": None,
+                "facets": None,
+                "spellcheck": None,
+                **overrides,
+            }
+        )
+
+    return _make_response
+
+
+@pytest.fixture(scope="class")
+def patched_solr_class():
+    """Patch pysolr.Solr once per test class, autospeccing it only once."""
+    with patch("solr_mcp_server.solr_client.pysolr.Solr", autospec=True) as solr_class:
+        yield solr_class
+
+
+@pytest.fixture
+def mock_solr_class(patched_solr_class, mock_solr):
+    """Fixture providing the patched pysolr.Solr, reset and returning ``mock_solr``."""
+    patched_solr_class.reset_mock()
+    patched_solr_class.return_value = mock_solr
+    return patched_solr_class
+
+
+@pytest.fixture
+def client(mock_solr_class, solr_config):
+    """Fixture providing a SOLRClient connected to ``mock_solr``."""
+    return SOLRClient(solr_config)
+
+
+@pytest.fixture(autouse=True)
+def clear_ping_cache():
+    """Keep the process-wide ping cache from leaking between tests."""
+    SOLRClient._ping_cache.clear()
+    yield
+    SOLRClient._ping_cache.clear()
+
+
 class TestSOLRClient:
     """Test cases for SOLR client."""
 
-    @patch("solr_mcp_server.solr_client.pysolr.Solr")
-    def test_init_success(self, mock_solr_class, solr_config):
+    def test_init_success(self, mock_solr_class, solr_config, mock_solr):
         """Test successful SOLR client initialization."""
-        mock_solr_instance = Mock()
-        mock_solr_instance.ping.return_value = True
-        mock_solr_class.return_value = mock_solr_instance
-
         client = SOLRClient(solr_config)
 
         mock_solr_class.assert_called_once_with(
@@ -56,19 +116,17 @@ class TestSOLRClient:
             auth=None,
             timeout=30,
             verify=True,
+            decoder=_JSON_DECODER,
+            session=client._session,
         )
-        mock_solr_instance.ping.assert_called_once()
+        mock_solr.ping.assert_called_once()
         assert client.config == solr_config
 
-    @patch("solr_mcp_server.solr_client.pysolr.Solr")
     def test_init_with_auth(self, mock_solr_class, solr_config):
         """Test SOLR client initialization with authentication."""
-        solr_config.username = "test_user"
-        solr_config.password = "test_pass"
-
-        mock_solr_instance = Mock()
-        mock_solr_instance.ping.return_value = True
-        mock_solr_class.return_value = mock_solr_instance
+        solr_config = solr_config.model_copy(
+            update={"username": "test_user", "password": "test_pass"}
+        )
 
         client = SOLRClient(solr_config)
 
@@ -77,323 +135,370 @@ class TestSOLRClient:
             auth=("test_user", "test_pass"),
             timeout=30,
             verify=True,
+            decoder=_JSON_DECODER,
+            session=client._session,
         )
 
-    @patch("solr_mcp_server.solr_client.pysolr.Solr")
-    def test_init_connection_failure(self, mock_solr_class, solr_config):
+    def test_init_connection_failure(self, mock_solr_class, solr_config, mock_solr):
         """Test SOLR client initialization with connection failure."""
-        mock_solr_instance = Mock()
-        mock_solr_instance.ping.side_effect = Exception("Connection failed")
-        mock_solr_class.return_value = mock_solr_instance
+        mock_solr.ping.side_effect = Exception("Connection failed")
 
-        with pytest.raises(SOLRConnectionError, match="Failed to connect to SOLR"):
+        with pytest.raises(SOLRConnectionError, match=_RE_CONNECT_FAILED):
             SOLRClient(solr_config)
 
-    def test_ping_success(self, solr_config, mock_solr):
+    def test_ping_success(self, client):
         """Test successful ping."""
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-            result = client.ping()
-            assert result is True
+        result = client.ping()
+        assert result is True
+
+    def test_ping_reuses_recent_success(self, client, mock_solr, solr_config):
+        """Test that a recent successful ping is not repeated unless forced."""
+        # A second client for the same collection skips the startup ping
+        SOLRClient(solr_config)
+        assert client.ping() is True
+        assert mock_solr.ping.call_count == 1
+
+        assert client.ping(force=True) is True
+        assert mock_solr.ping.call_count == 2
+
+    def test_ping_cache_is_keyed_on_credentials(self, client, mock_solr, solr_config):
+        """Test that a client with other credentials still checks the connection."""
+        auth_config = solr_config.model_copy(
+            update={"username": "test_user", "password": "wrong_pass"}
+        )
+        mock_solr.ping.side_effect = Exception("Unauthorized")
 
-    def test_ping_failure(self, solr_config, mock_solr):
+        # Skip the connection retry backoff
+        with patch("solr_mcp_server.solr_client.time.sleep"):
+            with pytest.raises(SOLRConnectionError, match=_RE_CONNECT_FAILED):
+                SOLRClient(auth_config)
+
+    def test_ping_failure(self, client, mock_solr):
         """Test ping failure."""
+        # The client connected, so only pings from here on fail
         mock_solr.ping.side_effect = Exception("Ping failed")
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-            mock_solr.ping.side_effect = Exception(
-                "Ping failed"
-            )  # Reset for second call
-            result = client.ping()
-            assert result is False
+        # Force the ping past the client's record of its startup ping
+        assert client.ping(force=True) is False
+        assert client.ping() is False
 
-    def test_basic_search(self, solr_config, mock_solr):
+    def test_basic_search(self, client, mock_solr, make_response):
         """Test basic search functionality."""
-        # Mock SOLR response
-        mock_response = Mock()
-        mock_response.docs = [
-            {
-                "id": "doc1",
-                "score": 1.5,
-                "title": "Test Document 1",
-                "content": "Some content",
-            },
-            {
-                "id": "doc2",
-                "score": 1.2,
-                "title": "Test Document 2",
-                "content": "More content",
-            },
-        ]
-        mock_response.hits = 2
-        mock_response.start = 0
-        mock_response.qtime = 15
-        mock_response.highlighting = None
-        mock_response.facets = None
-        mock_response.spellcheck = None
-
-        mock_solr.search.return_value = mock_response
-
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-            response = client.search("test query")
-
-            assert len(response.results) == 2
-            assert response.total_found == 2
-            assert response.start == 0
-            assert response.query_time == 15
-
-            # Check first result
-            assert response.results[0].id == "doc1"
-            assert response.results[0].score == 1.5
-            assert response.results[0].fields["title"] == "Test Document 1"
-            assert response.results[0].fields["content"] == "Some content"
-
-    def test_search_with_parameters(self, solr_config, mock_solr):
-        """Test search with various parameters."""
-        mock_response = Mock()
-        mock_response.docs = []
-        mock_response.hits = 0
-        mock_response.start = 10
-        mock_response.qtime = 5
-        mock_response.highlighting = None
-        mock_response.facets = None
-        mock_response.spellcheck = None
-
-        mock_solr.search.return_value = mock_response
-
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-
-            response = client.search(
-                query="advanced query",
-                fields=["title", "content"],
-                start=10,
-                rows=20,
-                sort="score desc",
-                filters=["type:document", "status:published"],
-            )
-
-            mock_solr.search.assert_called_once()
-            call_args = mock_solr.search.call_args[1]
-
-            assert call_args["q"] == "advanced query"
-            assert call_args["fl"] == "title,content"
-            assert call_args["start"] == 10
-            assert call_args["rows"] == 20
-            assert call_args["sort"] == "score desc"
-            assert call_args["fq"] == ["type:document", "status:published"]
-
-    def test_faceted_search(self, solr_config, mock_solr):
-        """Test faceted search functionality."""
-        mock_response = Mock()
-        mock_response.docs = []
-        mock_response.hits = 0
-        mock_response.highlighting = None
-        mock_response.spellcheck = None
-
-        # Mock facet response
-        mock_response.facets = {
-            "facet_fields": {
-                "category": ["books", 5, "articles", 3, "papers", 1],
-                "author": ["smith", 4, "jones", 2],
-            }
-        }
-
-        mock_solr.search.return_value = mock_response
-
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-
-            response = client.search(query="*:*", facet_fields=["category", "author"])
-
-            assert response.facets is not None
-            assert len(response.facets) == 2
+        mock_solr.search.return_value = make_response(
+            docs=[
+                {
+                    "id": "doc1",
+                    "score": 1.5,
+                    "title": "Test Document 1",
+                    "content": "Some content",
+                },
+                {
+                    "id": "doc2",
+                    "score": 1.2,
+                    "title": "Test Document 2",
+                    "content": "More content",
+                },
+            ],
+            hits=2,
+            qtime=15,
+        )
 
-            # Check category facet
-            category_facet = next(f for f in response.facets if f.name == "category")
-            assert len(category_facet.values) == 3
-            assert category_facet.values[0].value == "books"
-            assert category_facet.values[0].count == 5
+        response = client.search("test query")
 
-    def test_search_with_highlighting(self, solr_config, mock_solr):
-        """Test search with highlighting."""
-        mock_response = Mock()
-        mock_response.docs = [{"id": "doc1", "title": "Test Document"}]
-        mock_response.hits = 1
-        mock_response.highlighting = {
-            "doc1": {
-                "title": ["<mark>Test</mark> Document"],
-                "content": ["This is a <mark>test</mark> document"],
-            }
+        assert len(response.results) == 2
+        assert response.total_found == 2
+        assert response.start == 0
+        assert response.query_time == 15
+        assert response.facets == []
+
+        # Check first result
+        assert response.results[0].id == "doc1"
+        assert response.results[0].score == 1.5
+        assert response.results[0].fields == {
+            "title": "Test Document 1",
+            "content": "Some content",
         }
-        mock_response.facets = None
-        mock_response.spellcheck = None
 
-        mock_solr.search.return_value = mock_response
+    def test_search_with_parameters(self, client, mock_solr, make_response):
+        """Test search with various parameters."""
+        mock_solr.search.return_value = make_response(start=10, qtime=5)
+
+        response = client.search(
+            query="advanced query",
+            fields=["title", "content"],
+            start=10,
+            rows=20,
+            sort="score desc",
+            filters=["type:document", "status:published"],
+        )
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        mock_solr.search.assert_called_once()
+        call_args = mock_solr.search.call_args[1]
 
-            response = client.search(
-                query="test", highlight_fields=["title", "content"]
-            )
+        expected = {
+            "q": "advanced query",
+            "fl": "id,score,title,content",
+            "start": 10,
+            "rows": 20,
+            "sort": "score desc",
+            "fq": ["type:document", "status:published"],
+        }
+        assert {key: call_args[key] for key in expected} == expected
 
-            assert len(response.results) == 1
-            assert response.results[0].highlighting is not None
-            assert "title" in response.results[0].highlighting
-            assert (
-                "<mark>Test</mark> Document"
-                in response.results[0].highlighting["title"]
-            )
+    def test_faceted_search(self, client, mock_solr, make_response):
+        """Test faceted search functionality."""
+        mock_solr.search.return_value = make_response(
+            facets={
+                "facet_fields": {
+                    "category": ["books", 5, "articles", 3, "papers", 1],
+                    "author": ["smith", 4, "jones", 2],
+                }
+            }
+        )
 
-    def test_suggest_query(self, solr_config, mock_solr):
-        """Test query suggestions."""
-        mock_response = Mock()
-        mock_response.spellcheck = {
-            "suggestions": {"documnt": {"suggestion": ["document", "documents"]}}
-        }
+        response = client.search(query="*:*", facet_fields=["category", "author"])
 
-        mock_solr.search.return_value = mock_response
+        assert response.facets is not None
+        assert len(response.facets) == 2
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        # Check category facet
+        category_facet = next(f for f in response.facets if f.name == "category")
+        assert [(v.value, v.count) for v in category_facet.values] == [
+            ("books", 5),
+            ("articles", 3),
+            ("papers", 1),
+        ]
 
-            suggestions = client.suggest_query("documnt")
+    def test_faceted_search_uses_cached_facets(self, client, mock_solr, make_response):
+        """Test that repeated facet requests reuse cached facet counts."""
+        mock_solr.search.return_value = make_response(
+            qtime=1, facets={"facet_fields": {"category": ["books", 5]}}
+        )
 
-            assert "documnt" in suggestions
-            assert "document" in suggestions["documnt"]
-            assert "documents" in suggestions["documnt"]
+        client.search(query="*:*", facet_fields=["category"])
+        response = client.search(query="*:*", facet_fields=["category"])
+
+        # The second request skips faceting but still returns the counts
+        assert "facet" not in mock_solr.search.call_args[1]
+        assert response.facets[0].values[0].value == "books"
+
+        client.invalidate_facets()
+        client.search(query="*:*", facet_fields=["category"])
+        assert mock_solr.search.call_args[1]["facet"] == "true"
+
+    def test_cached_facets_keep_the_requested_order(
+        self, client, mock_solr, make_response
+    ):
+        """Test that cached facets are neither reordered nor shared."""
+        mock_solr.search.side_effect = lambda **params: make_response(
+            qtime=1,
+            facets={
+                "facet_fields": {
+                    name: [f"{name}-value", 1] for name in params.get("facet.field", ())
+                }
+            },
+        )
 
-    def test_get_schema_fields(self, solr_config, mock_solr):
-        """Test getting schema fields."""
-        mock_response = Mock()
-        mock_response.docs = [
-            {"id": "doc1", "title": "Test", "content": "Content", "category": "book"}
+        first = client.search(query="*:*", facet_fields=["author", "category"])
+        second = client.search(query="*:*", facet_fields=["category", "author"])
+        assert [f.name for f in first.facets] == ["author", "category"]
+        assert [f.name for f in second.facets] == ["category", "author"]
+
+        third = client.search(query="*:*", facet_fields=["author", "category"])
+        assert third.facets == first.facets
+        assert third.facets is not first.facets
+        assert "facet" not in mock_solr.search.call_args[1]
+
+    def test_search_with_contradictory_filters(self, client, mock_solr):
+        """Test that searches known to match nothing skip SOLR."""
+        response = client.search("test", filters=["type:doc", "-type:doc"])
+
+        assert response.total_found == 0
+        assert response.results == []
+        mock_solr.search.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            (["-*:*"], True),
+            (["type:doc", "-type:doc"], True),
+            # String fields compare range bounds as text, so SOLR decides
+            (["code:[10 TO 5]"], False),
+            (["type:doc", "status:published"], False),
+            # A leading "-" only negates the first clause of a compound filter
+            (["-type:a OR status:x", "type:a OR status:x"], False),
+            (["-type:a AND -status:x", "type:a AND -status:x"], False),
+            (["-(type:a OR type:b)", "(type:a OR type:b)"], False),
+            (["-type:a && status:x", "type:a && status:x"], False),
+            (['-title:"a b"', 'title:"a b"'], False),
+            (["-{!term f=type}a", "{!term f=type}a"], False),
+        ],
+    )
+    def test_is_contradictory(self, filters, expected):
+        """Test detection of filter lists that can never match."""
+        assert _is_contradictory(filters) is expected
+
+    def test_iter_search_follows_cursor(self, client, mock_solr):
+        """Test that iter_search pages through results with cursorMark."""
+        mock_solr.search.side_effect = [
+            SimpleNamespace(docs=[{"id": "doc1"}, {"id": "doc2"}], nextCursorMark="A"),
+            SimpleNamespace(docs=[{"id": "doc3"}], nextCursorMark="B"),
+            SimpleNamespace(docs=[], nextCursorMark="B"),
         ]
 
-        mock_solr.search.return_value = mock_response
-
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        results = list(client.iter_search("test", sort="date desc", batch_size=2))
 
-            fields = client.get_schema_fields()
+        assert [r.id for r in results] == ["doc1", "doc2", "doc3"]
+        cursors = [c[1]["cursorMark"] for c in mock_solr.search.call_args_list]
+        assert cursors == ["*", "A", "B"]
+        assert mock_solr.search.call_args[1]["sort"] == "date desc,id asc"
+        assert mock_solr.search.call_args[1]["rows"] == 2
 
-            assert "id" in fields
-            assert "title" in fields
-            assert "content" in fields
-            assert "category" in fields
+    def test_search_with_highlighting(self, client, mock_solr, make_response):
+        """Test search with highlighting."""
+        mock_solr.search.return_value = make_response(
+            docs=[{"id": "doc1", "title": "Test Document"}],
+            hits=1,
+            highlighting={
+                "doc1": {
+                    "title": ["<mark>Test</mark> Document"],
+                    "content": ["This is a <mark>test</mark> document"],
+                }
+            },
+        )
 
-    def test_get_collection_stats(self, solr_config, mock_solr):
-        """Test getting collection statistics."""
-        mock_response = Mock()
-        mock_response.hits = 1000
+        response = client.search(query="test", highlight_fields=["title", "content"])
 
-        mock_solr.search.return_value = mock_response
+        assert len(response.results) == 1
+        assert response.results[0].highlighting is not None
+        assert "title" in response.results[0].highlighting
+        assert "<mark>Test</mark> Document" in response.results[0].highlighting["title"]
+
+    def test_search_with_numeric_ids(self, client, mock_solr, make_response):
+        """Test that numeric document ids are returned as strings."""
+        mock_solr.search.return_value = make_response(
+            docs=[{"id": 42, "title": "Test Document"}],
+            hits=1,
+            highlighting={"42": {"title": ["<mark>Test</mark> Document"]}},
+        )
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        response = client.search(query="test", highlight_fields=["title"])
 
-            stats = client.get_collection_stats()
+        assert response.results[0].id == "42"
+        assert response.results[0].highlighting == {
+            "title": ["<mark>Test</mark> Document"]
+        }
 
-            assert stats["total_documents"] == 1000
-            assert stats["collection_name"] == "test_collection"
-            assert stats["solr_url"] == "http://localhost:8983/solr"
+    def test_suggest_query(self, client, mock_solr, make_response):
+        """Test query suggestions."""
+        mock_solr.search.return_value = make_response(
+            spellcheck={
+                "suggestions": {"documnt": {"suggestion": ["document", "documents"]}}
+            }
+        )
 
-    def test_search_solr_error(self, solr_config, mock_solr):
-        """Test search with SOLR error."""
-        mock_solr.search.side_effect = pysolr.SolrError("SOLR query failed")
+        suggestions = client.suggest_query("documnt")
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        assert "documnt" in suggestions
+        assert "document" in suggestions["documnt"]
+        assert "documents" in suggestions["documnt"]
 
-            with pytest.raises(SOLRQueryError, match="SOLR query failed"):
-                client.search("test query")
+    def test_get_schema_fields(self, client, mock_solr, make_response):
+        """Test getting schema fields."""
+        mock_solr.search.return_value = make_response(
+            docs=[
+                {
+                    "id": "doc1",
+                    "title": "Test",
+                    "content": "Content",
+                    "category": "book",
+                }
+            ]
+        )
 
-    def test_search_unexpected_error(self, solr_config, mock_solr):
-        """Test search with unexpected error."""
-        mock_solr.search.side_effect = Exception("Unexpected error")
+        # Fall back to sampling a document when the Schema API fails
+        with patch.object(client._session, "get", side_effect=Exception("Not found")):
+            fields = client.get_schema_fields()
 
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
+        assert {"id", "title", "content", "category"} <= set(fields)
 
-            with pytest.raises(SOLRQueryError, match="Unexpected error during search"):
-                client.search("test query")
+    def test_get_schema_fields_from_schema_api(self, client, mock_solr):
+        """Test getting schema fields from the Schema API."""
+        schema_response = Mock()
+        schema_response.json.return_value = {
+            "fields": [{"name": "id", "type": "string"}, {"name": "title"}]
+        }
 
-    def test_context_manager(self, solr_config, mock_solr):
-        """Test using SOLR client as context manager."""
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            with SOLRClient(solr_config) as client:
-                assert client.config == solr_config
-            # Should not raise any errors
+        with patch.object(
+            client._session, "get", return_value=schema_response
+        ) as mock_get:
+            fields = client.get_schema_fields()
 
-    def test_close(self, solr_config, mock_solr):
-        """Test closing SOLR client."""
-        with patch("solr_mcp_server.solr_client.pysolr.Solr", return_value=mock_solr):
-            client = SOLRClient(solr_config)
-            client.close()
-            assert client._solr is None
-
-
-class TestSearchResultModels:
-    """Test cases for search result models."""
-
-    def test_search_result_creation(self):
-        """Test SearchResult creation."""
-        result = SearchResult(
-            id="doc1",
-            score=1.5,
-            fields={"title": "Test", "content": "Content"},
-            highlighting={"title": ["<mark>Test</mark>"]},
+        assert fields == ["id", "title"]
+        assert mock_get.call_args[0][0] == (
+            "http://localhost:8983/solr/test_collection/schema/fields"
         )
+        mock_solr.search.assert_not_called()
 
-        assert result.id == "doc1"
-        assert result.score == 1.5
-        assert result.fields["title"] == "Test"
-        assert result.highlighting["title"] == ["<mark>Test</mark>"]
+    def test_get_schema_fields_is_cached(self, client):
+        """Test that schema fields are cached on the client."""
+        schema_response = Mock()
+        schema_response.json.return_value = {"fields": [{"name": "id"}]}
 
-    def test_facet_value_creation(self):
-        """Test FacetValue creation."""
-        facet_value = FacetValue(value="books", count=5)
+        with patch.object(
+            client._session, "get", return_value=schema_response
+        ) as mock_get:
+            assert client.get_schema_fields() == ["id"]
+            assert client.get_schema_fields() == ["id"]
 
-        assert facet_value.value == "books"
-        assert facet_value.count == 5
+        mock_get.assert_called_once()
 
-    def test_facet_field_creation(self):
-        """Test FacetField creation."""
-        facet_values = [
-            FacetValue(value="books", count=5),
-            FacetValue(value="articles", count=3),
-        ]
-        facet_field = FacetField(name="category", values=facet_values)
-
-        assert facet_field.name == "category"
-        assert len(facet_field.values) == 2
-        assert facet_field.values[0].value == "books"
+    def test_get_collection_stats(self, client, mock_solr, make_response):
+        """Test getting collection statistics."""
+        mock_solr.search.return_value = make_response(hits=1000)
+
+        stats = client.get_collection_stats()
+
+        assert stats["total_documents"] == 1000
+        assert stats["collection_name"] == "test_collection"
+        assert stats["solr_url"] == "http://localhost:8983/solr"
+
+    @pytest.mark.parametrize(
+        "error,expected,match",
+        [
+            (
+                pysolr.SolrError("SOLR query failed"),
+                SOLRQueryError,
+                _RE_QUERY_FAILED,
+            ),
+            # HTTP-level errors are reported as query failures too
+            (
+                requests.ConnectionError("Connection reset"),
+                SOLRQueryError,
+                _RE_CONNECTION_RESET,
+            ),
+            # Unexpected errors are not disguised as query failures
+            (ValueError("Unexpected error"), ValueError, _RE_UNEXPECTED),
+        ],
+    )
+    def test_search_error(self, client, mock_solr, error, expected, match):
+        """Test how search reports errors raised while querying SOLR."""
+        mock_solr.search.side_effect = error
 
-    def test_search_response_creation(self):
-        """Test SearchResponse creation."""
-        results = [SearchResult(id="doc1", fields={"title": "Test"})]
-        facets = [
-            FacetField(name="category", values=[FacetValue(value="books", count=5)])
-        ]
+        with pytest.raises(expected, match=match):
+            client.search("test query")
 
-        response = SearchResponse(
-            results=results,
-            total_found=1,
-            start=0,
-            rows=1,
-            query_time=15,
-            facets=facets,
-            suggestions={"test": ["tests", "testing"]},
-        )
+    def test_context_manager(self, client, solr_config):
+        """Test using SOLR client as context manager."""
+        with client as entered:
+            assert entered is client
+            assert client.config == solr_config
+        # Should not raise any errors
 
-        assert len(response.results) == 1
-        assert response.total_found == 1
-        assert response.query_time == 15
-        assert len(response.facets) == 1
-        assert "test" in response.suggestions
+    def test_close(self, client):
+        """Test closing SOLR client."""
+        client.close()
+        assert client._solr is None
 
 
 if __name__ == "__main__":